@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,6 +25,7 @@ from backend.schemas import (
     LlmProviderStatusOut,
     ModeUpdateRequest,
     ParametersUpdateRequest,
+    PROPOSAL_LIST_ADAPTER,
     ProposalOut,
 )
 
@@ -157,14 +159,14 @@ async def update_llm_credentials(
     return _build_llm_credentials_status(llm_map, get_settings())
 
 
-@router.post("/{id}/agent/chat", response_model=ChatResponse)
+@router.post("/{id}/agent/chat", response_model=ChatResponse, response_class=ORJSONResponse)
 async def chat(
     id: uuid.UUID,
     payload: ChatRequest,
     request: Request,
     current_client: Client = Depends(get_current_client),
     db: AsyncSession = Depends(get_db_session),
-) -> ChatResponse:
+) -> ORJSONResponse:
     assert_client_scope(id, current_client)
     creds = _decrypt_creds(current_client)
     manager = request.app.state.agent_manager
@@ -173,11 +175,14 @@ async def chat(
     except BrokerError as exc:
         raise broker_http_exception(exc, operation="get_agent", broker=current_client.broker_type) from exc
     try:
-        return ChatResponse.model_validate(await agent.chat(id, payload.message))
+        response = ChatResponse.model_validate(await agent.chat(id, payload.message))
     except BrokerError as exc:
         raise broker_http_exception(exc, operation="chat", broker=current_client.broker_type) from exc
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    # Already validated above; hand the tool traces straight to orjson instead of
+    # letting FastAPI re-validate and re-encode them through response_model.
+    return ORJSONResponse(content=response.model_dump(mode="json"))
 
 
 @router.post("/{id}/agent/approve/{trade_id}", response_model=ApproveRejectResponse)
@@ -349,4 +354,4 @@ async def list_proposals(
     rows = await db.execute(
         select(Proposal).where(Proposal.client_id == id).order_by(desc(Proposal.timestamp)).limit(100)
     )
-    return [ProposalOut.model_validate(row) for row in rows.scalars().all()]
+    return PROPOSAL_LIST_ADAPTER.validate_python(rows.scalars().all(), from_attributes=True)
@@ -9,7 +9,7 @@ from backend.auth.vault import CredentialVault
 from backend.brokers.base import BrokerError
 from backend.db.models import Client, Position
 from backend.db.session import get_db_session
-from backend.schemas import PositionOut
+from backend.schemas import POSITION_LIST_ADAPTER, PositionOut
 
 
 router = APIRouter(prefix="/clients", tags=["positions"])
@@ -46,4 +46,4 @@ async def get_positions(
     await db.commit()
 
     rows = await db.execute(select(Position).where(Position.client_id == id))
-    return [PositionOut.model_validate(item) for item in rows.scalars().all()]
+    return POSITION_LIST_ADAPTER.validate_python(rows.scalars().all(), from_attributes=True)
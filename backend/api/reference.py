@@ -6,7 +6,7 @@ from backend.api.deps import get_current_client, set_admin_db_context
 from backend.db.models import Client, Instrument, StrategyProfile
 from backend.db.session import get_db_session
 from backend.reference.seed_data import default_instruments, default_strategy_profiles
-from backend.schemas import InstrumentOut, StrategyProfileOut
+from backend.schemas import INSTRUMENT_LIST_ADAPTER, STRATEGY_PROFILE_LIST_ADAPTER, InstrumentOut, StrategyProfileOut
 
 
 router = APIRouter(prefix="/reference", tags=["reference"])
@@ -28,7 +28,7 @@ async def list_instruments(
         stmt = stmt.where(Instrument.symbol == symbol.upper())
     stmt = stmt.order_by(Instrument.asset_class, Instrument.symbol).limit(limit)
     rows = await db.execute(stmt)
-    return [InstrumentOut.model_validate(item) for item in rows.scalars().all()]
+    return INSTRUMENT_LIST_ADAPTER.validate_python(rows.scalars().all(), from_attributes=True)
 
 
 @router.get("/strategies", response_model=list[StrategyProfileOut])
@@ -40,7 +40,7 @@ async def list_strategies(
 ) -> list[StrategyProfileOut]:
     stmt = select(StrategyProfile).where(StrategyProfile.is_active == is_active).order_by(StrategyProfile.strategy_id).limit(limit)
     rows = await db.execute(stmt)
-    return [StrategyProfileOut.model_validate(item) for item in rows.scalars().all()]
+    return STRATEGY_PROFILE_LIST_ADAPTER.validate_python(rows.scalars().all(), from_attributes=True)
 
 
 @router.post("/seed-defaults")
@@ -8,6 +8,7 @@ from backend.brokers.base import BrokerError
 from backend.db.models import Client
 from backend.db.session import get_db_session
 from backend.schemas import (
+    STRATEGY_TEMPLATE_LIST_ADAPTER,
     StrategyExecutionOut,
     StrategyPreviewOut,
     StrategyTemplateCreateRequest,
@@ -49,7 +50,7 @@ async def list_templates(
 ) -> list[StrategyTemplateOut]:
     service = StrategyTemplateService(db)
     rows = await service.list_templates(current_client.id)
-    return [StrategyTemplateOut.model_validate(row) for row in rows]
+    return STRATEGY_TEMPLATE_LIST_ADAPTER.validate_python(rows, from_attributes=True)
 
 
 @router.get("/{template_id}", response_model=StrategyTemplateOut)
@@ -111,7 +112,7 @@ async def resolve_template(
         raise broker_http_exception(exc, operation="resolve", broker=current_client.broker_type) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return StrategyPreviewOut(**resolved.to_payload())
+    return StrategyPreviewOut.model_validate(resolved.to_payload())
 
 
 @router.post("/{template_id}/execute", response_model=StrategyExecutionOut)
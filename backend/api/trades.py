@@ -18,6 +18,8 @@ from backend.schemas import (
     ExecutionQualityOut,
     IncidentNoteCreateRequest,
     IncidentNoteOut,
+    TRADE_FILL_LIST_ADAPTER,
+    TRADE_LIST_ADAPTER,
     TradeFillIngestRequest,
     TradeFillOut,
     TradeOut,
@@ -40,7 +42,7 @@ async def get_trades(
     rows = await db.execute(
         select(Trade).where(Trade.client_id == id).order_by(desc(Trade.timestamp)).limit(limit)
     )
-    return [TradeOut.model_validate(row) for row in rows.scalars().all()]
+    return TRADE_LIST_ADAPTER.validate_python(rows.scalars().all(), from_attributes=True)
 
 
 @router.post("/{id}/trades/{trade_id}/fills", response_model=TradeFillOut)
@@ -162,7 +164,7 @@ async def get_trade_fills(
         .order_by(desc(TradeFill.fill_timestamp), desc(TradeFill.id))
         .limit(limit)
     )
-    return [TradeFillOut.model_validate(item) for item in rows.scalars().all()]
+    return TRADE_FILL_LIST_ADAPTER.validate_python(rows.scalars().all(), from_attributes=True)
 
 
 @router.get("/{id}/metrics/execution-quality", response_model=ExecutionQualityOut)
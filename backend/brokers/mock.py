@@ -14,6 +14,12 @@ class MockBroker(BrokerBase):
         self._positions: list[dict[str, Any]] = list(raw_positions) if isinstance(raw_positions, list) else []
         self._next_order = 1000
 
+    def reset(self) -> None:
+        # Restore the constructor state (seed positions, order ids) without reconnecting.
+        raw_positions = self._credentials.get("mock_positions", [])
+        self._positions = list(raw_positions) if isinstance(raw_positions, list) else []
+        self._next_order = 1000
+
     async def connect(self) -> None:
         self._connected = True
 
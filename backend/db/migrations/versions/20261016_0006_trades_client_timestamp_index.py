@@ -0,0 +1,22 @@
+"""add composite trades index for per-client daily risk queries
+
+Revision ID: 20261016_0006
+Revises: 20260226_0005
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+
+revision = "20261016_0006"
+down_revision = "20260226_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_trades_client_id_timestamp", "trades", ["client_id", "timestamp"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_trades_client_id_timestamp", table_name="trades")
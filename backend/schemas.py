@@ -1,11 +1,20 @@
 import uuid
 from datetime import datetime
-from typing import Literal
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import Annotated, Any, Literal
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, WithJsonSchema
+from pydantic.networks import validate_email
+
+
+def _normalize_email(value: str) -> str:
+    return validate_email(value)[1]
+
+
+# One shared email validator instead of an EmailStr schema per model.
+Email = Annotated[str, AfterValidator(_normalize_email), WithJsonSchema({"type": "string", "format": "email"})]
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -27,7 +36,7 @@ class AdminSessionLoginResponse(BaseModel):
 
 
 class OnboardRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
     broker_type: Literal["ibkr", "phillip"]
     broker_credentials: dict
@@ -69,8 +78,8 @@ class ChatRequest(BaseModel):
 class ToolCallEntry(BaseModel):
     tool_name: str | None = None
     name: str | None = None
-    tool_input: dict = Field(default_factory=dict)
-    input: dict = Field(default_factory=dict)
+    tool_input: dict[str, Any] = Field(default_factory=dict)
+    input: dict[str, Any] = Field(default_factory=dict)
     tool_use_id: str | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
@@ -84,8 +93,8 @@ class ToolResultEntry(BaseModel):
     tool_use_id: str | None = None
     ok: bool = True
     success: bool | None = None
-    result: dict | list | str | float | int | None = None
-    output: dict | list | str | float | int | None = None
+    result: Any = None
+    output: Any = None
     error: str | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
@@ -235,12 +244,20 @@ class ProposalOut(BaseModel):
     resolved_at: datetime | None
 
 
+class NetGreeks(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    delta: float = 0.0
+    gamma: float = 0.0
+    theta: float = 0.0
+    vega: float = 0.0
+
+
 class AgentStatusOut(BaseModel):
     client_id: uuid.UUID
     mode: str
     last_action: str | None
     healthy: bool
-    net_greeks: dict[str, float]
+    net_greeks: NetGreeks
 
 
 class AgentReadinessOut(BaseModel):
@@ -290,7 +307,7 @@ class EmergencyHaltResponse(BaseModel):
 class ClientOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     id: uuid.UUID
-    email: EmailStr
+    email: Email
     broker_type: str
     risk_params: dict
     mode: str
@@ -422,3 +439,14 @@ class StrategyExecutionOut(BaseModel):
     avg_fill_price: float | None
     execution_timestamp: datetime
     payload: dict
+
+
+# List adapters for ORM-backed list endpoints: validating a whole result set in
+# one pydantic-core call is cheaper than a model_validate() per row.
+POSITION_LIST_ADAPTER = TypeAdapter(list[PositionOut])
+TRADE_LIST_ADAPTER = TypeAdapter(list[TradeOut])
+TRADE_FILL_LIST_ADAPTER = TypeAdapter(list[TradeFillOut])
+PROPOSAL_LIST_ADAPTER = TypeAdapter(list[ProposalOut])
+INSTRUMENT_LIST_ADAPTER = TypeAdapter(list[InstrumentOut])
+STRATEGY_PROFILE_LIST_ADAPTER = TypeAdapter(list[StrategyProfileOut])
+STRATEGY_TEMPLATE_LIST_ADAPTER = TypeAdapter(list[StrategyTemplateOut])
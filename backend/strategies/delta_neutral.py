@@ -1,8 +1,14 @@
+from types import MappingProxyType
+
 from backend.strategies.greeks import aggregate_portfolio_greeks
 
 
+# Shared read-only greeks for flat portfolios; returned by reference, never mutated.
+_ZERO_GREEKS = MappingProxyType({"delta": 0.0, "gamma": 0.0, "theta": 0.0, "vega": 0.0})
+
+
 def detect_rebalance_need(positions: list[dict], delta_threshold: float) -> dict:
-    greeks = aggregate_portfolio_greeks(positions)
+    greeks = aggregate_portfolio_greeks(positions) if positions else _ZERO_GREEKS
     net_delta = greeks["delta"]
     return {
         "needs_rebalance": abs(net_delta) > delta_threshold,
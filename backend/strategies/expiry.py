@@ -0,0 +1,51 @@
+import calendar
+import re
+from datetime import date
+from functools import lru_cache
+
+
+_SEPARATED_DATE_RE = re.compile(r"^(\d{4})([-/])(\d{1,2})\2(\d{1,2})$")
+_COMPACT_DATE_RE = re.compile(r"^(\d{4})(\d{2})(\d{2})$")
+_RE_8DIGIT = re.compile(r"(\d{8})")
+_RE_6DIGIT = re.compile(r"(\d{6})")
+
+
+@lru_cache(maxsize=4096)
+def parse_expiry_date(raw_expiry: str) -> date | None:
+    # Chains repeat a handful of expiry strings across thousands of rows, so
+    # results are memoized and the common formats are matched without strptime.
+    raw = raw_expiry.strip()
+    if not raw:
+        return None
+
+    full_date = _SEPARATED_DATE_RE.match(raw)
+    if full_date:
+        year, month, day = full_date.group(1, 3, 4)
+    else:
+        full_date = _COMPACT_DATE_RE.match(raw)
+        if full_date:
+            year, month, day = full_date.groups()
+    if full_date:
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            pass
+
+    eight_digit = _RE_8DIGIT.search(raw)
+    if eight_digit:
+        token = eight_digit.group(1)
+        try:
+            return date(int(token[:4]), int(token[4:6]), int(token[6:8]))
+        except ValueError:
+            pass
+
+    six_digit = _RE_6DIGIT.search(raw)
+    if six_digit:
+        token = six_digit.group(1)
+        year = int(token[:4])
+        month = int(token[4:6])
+        if 1 <= month <= 12:
+            last_day = calendar.monthrange(year, month)[1]
+            return date(year, month, last_day)
+
+    return None
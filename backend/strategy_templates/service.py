@@ -1,11 +1,12 @@
 import uuid
-import calendar
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass
-from datetime import UTC, date, datetime
-import re
+from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import desc, select
+import numpy as np
+from sqlalchemy import desc, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.agent.risk import RiskGovernor
@@ -14,6 +15,54 @@ from backend.db.models import AuditLog, Client, Position, StrategyExecution, Str
 from backend.execution.fills import build_trade_fill_from_order, estimate_expected_price
 from backend.safety.emergency_halt import EmergencyHaltController
 from backend.schemas import StrategyTemplateCreateRequest, StrategyTemplateUpdateRequest
+from backend.strategies.expiry import parse_expiry_date
+
+
+# Underlying moves (as a fraction of spot) sampled for the preview PnL curve.
+_PNL_FACTORS = np.array([0.9, 0.95, 1.0, 1.05, 1.1])
+# Signed leg weights for net greeks: lower/center/upper calls, and lower put/center put/center call/upper call.
+_BUTTERFLY_WEIGHTS = np.array([1.0, -2.0, 1.0])
+_IRON_FLY_WEIGHTS = np.array([1.0, -1.0, -1.0, 1.0])
+
+
+def _butterfly_pnl(
+    s: np.ndarray, lower: float, center: float, upper: float, premium: float, scale: float
+) -> np.ndarray:
+    # Long lower call, two short center calls, long upper call; premium is the debit paid.
+    payoff = np.maximum(s - lower, 0.0) - 2.0 * np.maximum(s - center, 0.0) + np.maximum(s - upper, 0.0)
+    return (payoff - premium) * scale
+
+
+def _iron_fly_pnl(
+    s: np.ndarray, lower: float, center: float, upper: float, premium: float, scale: float
+) -> np.ndarray:
+    # Short straddle + long wings; premium is the credit received.
+    payoff = (
+        np.maximum(lower - s, 0.0)
+        - np.maximum(center - s, 0.0)
+        - np.maximum(s - center, 0.0)
+        + np.maximum(s - upper, 0.0)
+    )
+    return (premium + payoff) * scale
+
+
+@dataclass(frozen=True, slots=True)
+class _LegQuote:
+    call_delta: float
+    put_delta: float
+    gamma: float
+    theta: float
+    vega: float
+    call_mid: float
+    put_mid: float
+
+
+@dataclass(frozen=True, slots=True)
+class _RiskSnapshot:
+    checked_at: datetime
+    day_pnl: float
+    recent_pnls: list[float]
+    open_legs: int
 
 
 @dataclass
@@ -75,9 +124,10 @@ class StrategyTemplateService:
             auto_execute=payload.auto_execute,
         )
         self.db.add(template)
+        await self.db.flush()
+        await self._audit(client_id, "strategy_template_created", {"template_id": template.id, "name": template.name})
         await self.db.commit()
         await self.db.refresh(template)
-        await self._audit(client_id, "strategy_template_created", {"template_id": template.id, "name": template.name})
         return template
 
     async def list_templates(self, client_id: uuid.UUID, limit: int = 100) -> list[StrategyTemplate]:
@@ -116,44 +166,68 @@ class StrategyTemplateService:
         template.max_contracts = payload.max_contracts
         template.hedge_enabled = payload.hedge_enabled
         template.auto_execute = payload.auto_execute
+        await self._audit(client_id, "strategy_template_updated", {"template_id": template_id})
         await self.db.commit()
         await self.db.refresh(template)
-        await self._audit(client_id, "strategy_template_updated", {"template_id": template_id})
         return template
 
     async def delete_template(self, client_id: uuid.UUID, template_id: int) -> None:
         template = await self.get_template(client_id, template_id)
         await self.db.delete(template)
-        await self.db.commit()
         await self._audit(client_id, "strategy_template_deleted", {"template_id": template_id})
+        await self.db.commit()
 
     async def resolve_strategy_template(
         self,
         client_id: uuid.UUID,
         template_id: int,
         broker: BrokerBase,
+        template: StrategyTemplate | None = None,
     ) -> ResolvedStrategy:
-        template = await self.get_template(client_id, template_id)
+        if template is None:
+            template = await self.get_template(client_id, template_id)
         chain = await broker.get_options_chain(template.underlying_symbol, None)
         if not chain:
             raise ValueError(f"No options chain data returned for {template.underlying_symbol}")
 
-        valid_rows = [row for row in chain if row.get("expiry")]
-        if not valid_rows:
+        # One pass groups the chain by expiry; a second pass over the selected
+        # expiry only picks the center row and indexes rows by strike.
+        rows_by_expiry: dict[str, list[dict[str, Any]]] = {}
+        for row in chain:
+            raw_expiry = row.get("expiry")
+            if raw_expiry:
+                rows_by_expiry.setdefault(str(raw_expiry).strip(), []).append(row)
+        if not rows_by_expiry:
             raise ValueError("No expiry data in options chain")
 
-        selected_expiry, selected_dte = self._select_expiry(valid_rows, template.dte_min, template.dte_max)
-        expiry_rows = [row for row in valid_rows if str(row.get("expiry")) == selected_expiry]
-        if not expiry_rows:
-            raise ValueError(f"No rows found for selected expiry {selected_expiry}")
-
-        center = min(
-            expiry_rows,
-            key=lambda row: abs(abs(float(row.get("call_delta", 0.0))) - template.center_delta_target),
+        selected_expiry, selected_dte = self._select_expiry_from_values(
+            rows_by_expiry, template.dte_min, template.dte_max
         )
-        center_strike = float(center["strike"])
 
-        strikes = sorted({float(row["strike"]) for row in expiry_rows if row.get("strike") is not None})
+        center_target = template.center_delta_target
+        center: dict[str, Any] | None = None
+        center_strike = 0.0
+        best_center_distance = float("inf")
+        rows_by_strike: dict[float, dict[str, Any]] = {}
+        for row in rows_by_expiry[selected_expiry]:
+            raw_strike = row.get("strike")
+            if raw_strike is None:
+                continue
+            strike = float(raw_strike)
+            rows_by_strike.setdefault(strike, row)
+            call_delta = row.get("call_delta")
+            if call_delta is None:
+                # Without a delta the row cannot be judged ATM; it stays available as a wing.
+                continue
+            distance = abs(abs(float(call_delta)) - center_target)
+            if distance < best_center_distance:
+                best_center_distance = distance
+                center = row
+                center_strike = strike
+        if center is None:
+            raise ValueError(f"No rows found for selected expiry {selected_expiry}")
+
+        strikes = sorted(rows_by_strike)
         upper_width = template.wing_width if template.strategy_type != "broken_wing_butterfly" else template.wing_width * 1.5
         lower_strike, upper_strike = self._select_wing_strikes(
             strikes=strikes,
@@ -162,8 +236,8 @@ class StrategyTemplateService:
             upper_width=upper_width,
         )
 
-        lower_row = self._row_for_strike(expiry_rows, lower_strike)
-        upper_row = self._row_for_strike(expiry_rows, upper_strike)
+        lower_row = rows_by_strike.get(lower_strike)
+        upper_row = rows_by_strike.get(upper_strike)
         if not lower_row or not upper_row:
             raise ValueError("Missing required wing contracts in options chain")
 
@@ -181,18 +255,19 @@ class StrategyTemplateService:
         if underlying <= 0:
             underlying = center_strike
 
-        lower_call_mid = self._extract_mid(lower_row, "call")
-        center_call_mid = self._extract_mid(center, "call")
-        upper_call_mid = self._extract_mid(upper_row, "call")
-        lower_put_mid = self._extract_mid(lower_row, "put")
-        center_put_mid = self._extract_mid(center, "put")
+        # Read each selected row's numbers once; premium, greeks and legs all reuse them.
+        lower_quote = self._quote(lower_row)
+        center_quote = self._quote(center)
+        upper_quote = self._quote(upper_row)
 
         if template.strategy_type == "iron_fly":
             # Credit structure: sell ATM straddle, buy wings.
-            estimated_net_premium = (center_call_mid + center_put_mid) - (lower_put_mid + upper_call_mid)
+            estimated_net_premium = (center_quote.call_mid + center_quote.put_mid) - (
+                lower_quote.put_mid + upper_quote.call_mid
+            )
         else:
             # Debit call butterfly structures.
-            estimated_net_premium = (lower_call_mid + upper_call_mid) - (2.0 * center_call_mid)
+            estimated_net_premium = (lower_quote.call_mid + upper_quote.call_mid) - (2.0 * center_quote.call_mid)
 
         contract_multiplier = float(center.get("multiplier") or 50.0)
         if template.strategy_type == "iron_fly":
@@ -213,63 +288,36 @@ class StrategyTemplateService:
             )
 
         if template.strategy_type == "iron_fly":
-            net_delta_1 = (
-                -float(center.get("call_delta", 0.0))
-                - float(center.get("put_delta", 0.0))
-                + float(lower_row.get("put_delta", 0.0))
-                + float(upper_row.get("call_delta", 0.0))
+            leg_greeks = np.array(
+                [
+                    (lower_quote.put_delta, lower_quote.gamma, lower_quote.theta, lower_quote.vega),
+                    (center_quote.put_delta, center_quote.gamma, center_quote.theta, center_quote.vega),
+                    (center_quote.call_delta, center_quote.gamma, center_quote.theta, center_quote.vega),
+                    (upper_quote.call_delta, upper_quote.gamma, upper_quote.theta, upper_quote.vega),
+                ]
             )
-            net_gamma = (
-                -float(center.get("gamma", 0.0))
-                - float(center.get("gamma", 0.0))
-                + float(lower_row.get("gamma", 0.0))
-                + float(upper_row.get("gamma", 0.0))
-            ) * contracts
-            net_theta = (
-                -float(center.get("theta", 0.0))
-                - float(center.get("theta", 0.0))
-                + float(lower_row.get("theta", 0.0))
-                + float(upper_row.get("theta", 0.0))
-            ) * contracts
-            net_vega = (
-                -float(center.get("vega", 0.0))
-                - float(center.get("vega", 0.0))
-                + float(lower_row.get("vega", 0.0))
-                + float(upper_row.get("vega", 0.0))
-            ) * contracts
+            weights = _IRON_FLY_WEIGHTS
             legs = [
-                self._leg("BUY", 1, template, selected_expiry, lower_strike, lower_row, right="P"),
-                self._leg("SELL", 1, template, selected_expiry, center_strike, center, right="P"),
-                self._leg("SELL", 1, template, selected_expiry, center_strike, center, right="C"),
-                self._leg("BUY", 1, template, selected_expiry, upper_strike, upper_row, right="C"),
+                self._leg("BUY", 1, template, selected_expiry, lower_strike, lower_row, lower_quote, right="P"),
+                self._leg("SELL", 1, template, selected_expiry, center_strike, center, center_quote, right="P"),
+                self._leg("SELL", 1, template, selected_expiry, center_strike, center, center_quote, right="C"),
+                self._leg("BUY", 1, template, selected_expiry, upper_strike, upper_row, upper_quote, right="C"),
             ]
         else:
-            net_delta_1 = (
-                float(lower_row.get("call_delta", 0.0))
-                - (2.0 * float(center.get("call_delta", 0.0)))
-                + float(upper_row.get("call_delta", 0.0))
+            leg_greeks = np.array(
+                [
+                    (lower_quote.call_delta, lower_quote.gamma, lower_quote.theta, lower_quote.vega),
+                    (center_quote.call_delta, center_quote.gamma, center_quote.theta, center_quote.vega),
+                    (upper_quote.call_delta, upper_quote.gamma, upper_quote.theta, upper_quote.vega),
+                ]
             )
-            net_gamma = (
-                float(lower_row.get("gamma", 0.0))
-                - (2.0 * float(center.get("gamma", 0.0)))
-                + float(upper_row.get("gamma", 0.0))
-            ) * contracts
-            net_theta = (
-                float(lower_row.get("theta", 0.0))
-                - (2.0 * float(center.get("theta", 0.0)))
-                + float(upper_row.get("theta", 0.0))
-            ) * contracts
-            net_vega = (
-                float(lower_row.get("vega", 0.0))
-                - (2.0 * float(center.get("vega", 0.0)))
-                + float(upper_row.get("vega", 0.0))
-            ) * contracts
+            weights = _BUTTERFLY_WEIGHTS
             legs = [
-                self._leg("BUY", 1, template, selected_expiry, lower_strike, lower_row, right="C"),
-                self._leg("SELL", 2, template, selected_expiry, center_strike, center, right="C"),
-                self._leg("BUY", 1, template, selected_expiry, upper_strike, upper_row, right="C"),
+                self._leg("BUY", 1, template, selected_expiry, lower_strike, lower_row, lower_quote, right="C"),
+                self._leg("SELL", 2, template, selected_expiry, center_strike, center, center_quote, right="C"),
+                self._leg("BUY", 1, template, selected_expiry, upper_strike, upper_row, upper_quote, right="C"),
             ]
-        net_delta = net_delta_1 * contracts
+        net_delta, net_gamma, net_theta, net_vega = (weights @ leg_greeks * contracts).tolist()
 
         curve = self._estimate_pnl_curve(
             underlying=underlying,
@@ -310,13 +358,17 @@ class StrategyTemplateService:
         emergency_halt: EmergencyHaltController | None = None,
     ) -> StrategyExecution:
         await self._enforce_execution_controls(client_id, emergency_halt)
-        resolved = await self.resolve_strategy_template(client_id, template_id, broker)
         template = await self.get_template(client_id, template_id)
         client = await self.db.get(Client, client_id)
         if client is None:
             raise ValueError("Client not found")
 
-        await self._enforce_risk(client, template, resolved.contracts)
+        # The snapshot query runs before the broker fetch so the session is never shared between
+        # concurrent tasks; the template is passed in so resolving does not load it a second time.
+        risk_snapshot = await self._load_risk_snapshot(client_id)
+        resolved = await self.resolve_strategy_template(client_id, template_id, broker, template=template)
+
+        self._enforce_risk(client, template, resolved.contracts, risk_snapshot)
 
         if not hasattr(broker, "submit_combo_order"):
             raise BrokerOrderError("Broker does not support combo BAG orders")
@@ -377,9 +429,6 @@ class StrategyTemplateService:
         if fill is not None:
             self.db.add(fill)
 
-        await self.db.commit()
-        await self.db.refresh(execution)
-
         await self._audit(
             client_id,
             "strategy_template_executed",
@@ -390,15 +439,56 @@ class StrategyTemplateService:
                 "status": execution.status,
             },
         )
+        await self.db.commit()
+        await self.db.refresh(execution)
         return execution
 
-    async def _enforce_risk(
-        self,
+    async def _load_risk_snapshot(self, client_id: uuid.UUID) -> _RiskSnapshot:
+        now = datetime.now(UTC)
+        start_utc = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_filter = (Trade.client_id == client_id, Trade.timestamp >= start_utc)
+        # One round trip served by ix_trades_client_id_timestamp: the day's SUM and the open-leg
+        # COUNT are outer-joined to the three most recent trades, so a day without trades still
+        # yields one row. Trade.id breaks timestamp ties so the window never repeats or skips a
+        # trade. A trade without a recorded pnl counts as 0.0 (not a loss): it stays in the window
+        # and breaks a losing streak instead of being dropped.
+        recent = (
+            select(Trade.timestamp, Trade.id, func.coalesce(Trade.pnl, 0.0).label("pnl"))
+            .where(*day_filter)
+            .order_by(desc(Trade.timestamp), desc(Trade.id))
+            .limit(3)
+            .subquery()
+        )
+        totals = select(
+            select(func.coalesce(func.sum(Trade.pnl), 0.0)).where(*day_filter).scalar_subquery().label("day_pnl"),
+            select(func.count())
+            .select_from(Position)
+            .where(Position.client_id == client_id)
+            .scalar_subquery()
+            .label("open_legs"),
+        ).subquery()
+        rows = (
+            await self.db.execute(
+                select(totals.c.day_pnl, totals.c.open_legs, recent.c.pnl)
+                .select_from(totals.outerjoin(recent, true()))
+                .order_by(desc(recent.c.timestamp), desc(recent.c.id))
+            )
+        ).all()
+        return _RiskSnapshot(
+            checked_at=now,
+            day_pnl=float(rows[0].day_pnl),
+            recent_pnls=[float(row.pnl) for row in rows if row.pnl is not None],
+            open_legs=rows[0].open_legs,
+        )
+
+    @staticmethod
+    def _enforce_risk(
         client: Client,
         template: StrategyTemplate,
         resolved_contracts: int,
+        snapshot: _RiskSnapshot,
     ) -> None:
-        if not RiskGovernor._is_market_hours(datetime.now(UTC).time()):
+        if not RiskGovernor._is_market_hours(snapshot.checked_at.time()):
             raise ValueError("Order attempted outside configured market hours")
 
         risk_params = client.risk_params or {}
@@ -406,23 +496,14 @@ class StrategyTemplateService:
         max_open_positions = int(risk_params.get("max_open_positions", 20))
         max_size = int(risk_params.get("max_size", 10))
 
-        start_utc = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-        trades_result = await self.db.execute(
-            select(Trade)
-            .where(Trade.client_id == client.id, Trade.timestamp >= start_utc)
-            .order_by(desc(Trade.timestamp))
-            .limit(500)
-        )
-        day_trades = list(trades_result.scalars().all())
-        day_pnl = sum(float(t.pnl) for t in day_trades)
+        day_pnl = snapshot.day_pnl
         if day_pnl <= -abs(max_daily_loss):
             raise ValueError(f"Daily loss limit breached: {day_pnl:.2f} <= -{max_daily_loss:.2f}")
-        consecutive_losses = [float(t.pnl) for t in day_trades[:3]]
+        consecutive_losses = snapshot.recent_pnls
         if len(consecutive_losses) >= 3 and all(loss <= -500 for loss in consecutive_losses):
             raise ValueError("Circuit breaker active: 3 consecutive losses > $500")
 
-        pos_result = await self.db.execute(select(Position).where(Position.client_id == client.id))
-        open_legs = len(list(pos_result.scalars().all()))
+        open_legs = snapshot.open_legs
         if open_legs >= max_open_positions:
             raise ValueError(f"Max open positions reached: {open_legs}/{max_open_positions}")
 
@@ -446,22 +527,12 @@ class StrategyTemplateService:
             "emergency_halt_blocked",
             {"reason": state.reason, "operation": "strategy_template_execute"},
         )
+        await self.db.commit()
         raise ValueError("Trading is globally halted by emergency control")
 
     async def _audit(self, client_id: uuid.UUID, event_type: str, details: dict[str, Any]) -> None:
+        # Staged only; callers commit it together with the change being audited.
         self.db.add(AuditLog(client_id=client_id, event_type=event_type, details=details))
-        await self.db.commit()
-
-    @staticmethod
-    def _row_for_strike(rows: list[dict[str, Any]], strike: float) -> dict[str, Any] | None:
-        for row in rows:
-            if float(row.get("strike", 0.0)) == strike:
-                return row
-        return None
-
-    @staticmethod
-    def _nearest_strike(strikes: list[float], target: float) -> float:
-        return min(strikes, key=lambda x: abs(x - target))
 
     @staticmethod
     def _select_wing_strikes(
@@ -470,11 +541,12 @@ class StrategyTemplateService:
         lower_width: float,
         upper_width: float,
     ) -> tuple[float, float]:
-        lower_candidates = [strike for strike in strikes if strike < center_strike]
-        upper_candidates = [strike for strike in strikes if strike > center_strike]
-        if not lower_candidates or not upper_candidates:
-            low = min(strikes) if strikes else center_strike
-            high = max(strikes) if strikes else center_strike
+        # Strikes arrive sorted, so each wing is located by bisection instead of scanning the chain.
+        lower_end = bisect_left(strikes, center_strike)
+        upper_start = bisect_right(strikes, center_strike)
+        if lower_end == 0 or upper_start == len(strikes):
+            low = strikes[0] if strikes else center_strike
+            high = strikes[-1] if strikes else center_strike
             raise ValueError(
                 "Unable to construct butterfly wings from current chain. "
                 f"Need strikes both below and above center {center_strike}, available range is {low}-{high}."
@@ -482,19 +554,38 @@ class StrategyTemplateService:
 
         lower_target = center_strike - max(lower_width, 0.0)
         upper_target = center_strike + max(upper_width, 0.0)
-        lower_strike = min(lower_candidates, key=lambda x: abs(x - lower_target))
-        upper_strike = min(upper_candidates, key=lambda x: abs(x - upper_target))
+        lower_strike = StrategyTemplateService._nearest_strike(strikes, lower_target, 0, lower_end)
+        upper_strike = StrategyTemplateService._nearest_strike(strikes, upper_target, upper_start, len(strikes))
         return lower_strike, upper_strike
 
+    @staticmethod
+    def _nearest_strike(strikes: list[float], target: float, lo: int = 0, hi: int | None = None) -> float:
+        # Closest of the sorted strikes[lo:hi] to target; ties go to the lower strike.
+        if hi is None:
+            hi = len(strikes)
+        idx = bisect_left(strikes, target, lo, hi)
+        if idx == lo:
+            return strikes[lo]
+        if idx == hi:
+            return strikes[hi - 1]
+        below, above = strikes[idx - 1], strikes[idx]
+        return above if abs(above - target) < abs(below - target) else below
+
     @staticmethod
     def _select_expiry(chain_rows: list[dict[str, Any]], dte_min: int, dte_max: int) -> tuple[str, int]:
+        return StrategyTemplateService._select_expiry_from_values(
+            (str(row["expiry"]) for row in chain_rows), dte_min, dte_max
+        )
+
+    @staticmethod
+    def _select_expiry_from_values(expiries: Iterable[str], dte_min: int, dte_max: int) -> tuple[str, int]:
         expiry_map: dict[str, int] = {}
         now = datetime.now(UTC).date()
-        for row in chain_rows:
-            exp = str(row["expiry"]).strip()
+        for raw in expiries:
+            exp = raw.strip()
             if exp in expiry_map:
                 continue
-            exp_date = StrategyTemplateService._parse_expiry_date(exp)
+            exp_date = parse_expiry_date(exp)
             if exp_date is None:
                 continue
             dte = (exp_date - now).days
@@ -512,36 +603,6 @@ class StrategyTemplateService:
         midpoint = (dte_min + dte_max) / 2
         return min(allowed, key=lambda item: abs(item[1] - midpoint))
 
-    @staticmethod
-    def _parse_expiry_date(raw_expiry: str) -> date | None:
-        raw = raw_expiry.strip()
-        if not raw:
-            return None
-
-        for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d"):
-            try:
-                return datetime.strptime(raw, fmt).date()
-            except ValueError:
-                continue
-
-        eight_digit = re.search(r"(\d{8})", raw)
-        if eight_digit:
-            try:
-                return datetime.strptime(eight_digit.group(1), "%Y%m%d").date()
-            except ValueError:
-                pass
-
-        six_digit = re.search(r"(\d{6})", raw)
-        if six_digit:
-            token = six_digit.group(1)
-            year = int(token[:4])
-            month = int(token[4:6])
-            if 1 <= month <= 12:
-                last_day = calendar.monthrange(year, month)[1]
-                return date(year, month, last_day)
-
-        return None
-
     @staticmethod
     def _extract_mid(row: dict[str, Any], side: str) -> float:
         bid = StrategyTemplateService._safe_float(row.get(f"{side}_bid"))
@@ -553,13 +614,32 @@ class StrategyTemplateService:
             return (bid + ask) / 2
         return 0.0
 
+    @staticmethod
+    def _quote(row: dict[str, Any]) -> _LegQuote:
+        safe_float = StrategyTemplateService._safe_float
+        return _LegQuote(
+            call_delta=safe_float(row.get("call_delta")),
+            put_delta=safe_float(row.get("put_delta")),
+            gamma=safe_float(row.get("gamma")),
+            theta=safe_float(row.get("theta")),
+            vega=safe_float(row.get("vega")),
+            call_mid=StrategyTemplateService._extract_mid(row, "call"),
+            put_mid=StrategyTemplateService._extract_mid(row, "put"),
+        )
+
     @staticmethod
     def _safe_float(value: Any) -> float:
+        # Broker payloads are almost always float/int already; skip float() and the handler for those.
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
+            return float(value)
+        if value is None:
+            return 0.0
         try:
-            if value is None:
-                return 0.0
             return float(value)
-        except Exception:  # noqa: BLE001
+        except (TypeError, ValueError, OverflowError):
             return 0.0
 
     @staticmethod
@@ -570,9 +650,10 @@ class StrategyTemplateService:
         expiry: str,
         strike: float,
         row: dict[str, Any],
+        quote: _LegQuote,
         right: str,
     ) -> dict[str, Any]:
-        side = "put" if right.upper() == "P" else "call"
+        is_put = right.upper() == "P"
         return {
             "action": action,
             "ratio": ratio,
@@ -584,8 +665,8 @@ class StrategyTemplateService:
             "exchange": row.get("exchange", "CME"),
             "trading_class": row.get("trading_class"),
             "multiplier": str(row.get("multiplier")) if row.get("multiplier") else None,
-            "delta": StrategyTemplateService._safe_float(row.get(f"{side}_delta")),
-            "mid_price": StrategyTemplateService._extract_mid(row, side),
+            "delta": quote.put_delta if is_put else quote.call_delta,
+            "mid_price": quote.put_mid if is_put else quote.call_mid,
         }
 
     @staticmethod
@@ -598,22 +679,14 @@ class StrategyTemplateService:
         multiplier: float,
         contracts: int,
         strategy_type: str,
+        factors: np.ndarray = _PNL_FACTORS,
     ) -> list[dict[str, float]]:
-        points = [0.9, 0.95, 1.0, 1.05, 1.1]
-        out: list[dict[str, float]] = []
-        for factor in points:
-            s = underlying * factor
-            if strategy_type == "iron_fly":
-                # Short straddle + long wings.
-                payoff = (
-                    max(lower - s, 0.0)
-                    - max(center - s, 0.0)
-                    - max(s - center, 0.0)
-                    + max(s - upper, 0.0)
-                )
-                pnl = (premium + payoff) * multiplier * contracts
-            else:
-                payoff = max(s - lower, 0.0) - 2.0 * max(s - center, 0.0) + max(s - upper, 0.0)
-                pnl = (payoff - premium) * multiplier * contracts
-            out.append({"underlying": round(s, 2), "pnl": round(pnl, 2)})
-        return out
+        s = underlying * factors
+        if strategy_type == "iron_fly":
+            pnl = _iron_fly_pnl(s, lower, center, upper, premium, multiplier * contracts)
+        else:
+            pnl = _butterfly_pnl(s, lower, center, upper, premium, multiplier * contracts)
+        return [
+            {"underlying": round(price, 2), "pnl": round(value, 2)}
+            for price, value in zip(s.tolist(), pnl.tolist())
+        ]
@@ -0,0 +1,10 @@
+from fastapi import APIRouter, FastAPI
+
+
+def create_test_app(*routers: APIRouter) -> FastAPI:
+    # No docs or schema routes: tests only call the API itself. Responses keep FastAPI's default
+    # JSONResponse, as in main.py; routes that opt into orjson declare it themselves.
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    for router in routers:
+        app.include_router(router)
+    return app
@@ -0,0 +1,136 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.agent.core import TradingAgent
+from backend.agent.risk import RiskGovernor
+from backend.api import agent as agent_api
+from backend.api import clients as clients_api
+from backend.api import reference as reference_api
+from backend.brokers.mock import MockBroker
+from backend.tests.apps import create_test_app
+from backend.tests.engines import create_schema, create_test_engine
+from backend.tests.factories import reset_uuid_counter
+
+try:  # uvloop ships with uvicorn[standard] everywhere except Windows.
+    import uvloop
+except ImportError:  # pragma: no cover - platform dependent
+    uvloop = None
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # One event loop per worker: module-scoped engines and HTTP clients are then reusable by every
+    # test without per-test loop setup (async fixtures default to the session loop in pytest.ini).
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    if uvloop is None:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def engine() -> AsyncIterator[AsyncEngine]:
+    # One in-memory schema per test module; each test runs inside a transaction rolled back by `db`.
+    test_engine = create_test_engine(savepoints=True)
+    await create_schema(test_engine)
+    yield test_engine
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture(scope="module")
+def app() -> FastAPI:
+    # Built once per module; tests install their own dependency_overrides and app.state.
+    return create_test_app(agent_api.router, clients_api.router, reference_api.router)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def http(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _clear_dependency_overrides(request: pytest.FixtureRequest) -> Iterator[None]:
+    yield
+    if "app" in request.fixturenames:
+        request.getfixturevalue("app").dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def connected_broker() -> MockBroker:
+    mock_broker = MockBroker()
+    await mock_broker.connect()
+    return mock_broker
+
+
+@pytest.fixture
+def broker(connected_broker: MockBroker) -> MockBroker:
+    connected_broker.reset()
+    return connected_broker
+
+
+@pytest.fixture
+def risk_governor() -> RiskGovernor:
+    # Fresh per test so loss streaks never leak; market hours are pinned open for determinism.
+    governor = RiskGovernor()
+    governor._is_market_hours = lambda _: True  # type: ignore[method-assign]
+    return governor
+
+
+@pytest.fixture(autouse=True)
+def _stable_ids() -> None:
+    reset_uuid_counter()
+
+
+@pytest.fixture(autouse=True)
+def _no_llm(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Keep chat tests off the network: the stubbed Ollama call answers at once with the agent's
+    # deterministic reasoning and trade and no tool activity. An unreachable endpoint would instead
+    # return None and fall through to Anthropic (when a key is set), so that path is not exercised
+    # here. Opt out with @pytest.mark.real_llm.
+    if request.node.get_closest_marker("real_llm") is not None:
+        return
+
+    async def _fallback_ollama(
+        self: TradingAgent,
+        *,
+        fallback_reasoning: str,
+        fallback_trade: dict[str, Any] | None,
+        tool_trace_id: str,
+        **_kwargs: Any,
+    ) -> dict[str, Any]:
+        return {
+            "reasoning": fallback_reasoning,
+            "trade": fallback_trade,
+            "tool_trace_id": tool_trace_id,
+            "planned_tools": [],
+            "tool_calls": [],
+            "tool_results": [],
+        }
+
+    monkeypatch.setattr(TradingAgent, "_call_ollama", _fallback_ollama)
@@ -0,0 +1,64 @@
+import uuid
+from functools import cache
+
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from backend.db.models import Base
+
+
+def create_test_engine(*, savepoints: bool = False) -> AsyncEngine:
+    # Uniquely named shared-cache memory DB on one pooled connection: every checkout sees the
+    # schema just created, and engines never leak rows into each other.
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///file:test-{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # Test data is throwaway, so skip durability work on every commit.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    if not savepoints:
+        return engine
+
+    # pysqlite manages transactions itself and never emits SAVEPOINT-compatible BEGINs; take over
+    # so sessions can nest savepoints inside an outer transaction. Every statement then runs in an
+    # explicit transaction, so only use this when sessions never share the connection concurrently.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, _record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@cache
+def _schema_script() -> str:
+    # The same CREATE TABLE / CREATE INDEX statements create_all would emit, compiled once per
+    # process. aiosqlite compiles DDL exactly like the base SQLite dialect.
+    dialect = sqlite.dialect()
+    tables = Base.metadata.sorted_tables
+    statements = [CreateTable(table) for table in tables]
+    statements += [CreateIndex(index) for table in tables for index in table.indexes]
+    return ";\n".join(str(statement.compile(dialect=dialect)) for statement in statements) + ";"
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+    # Replays the precompiled DDL in a single executescript instead of compiling and executing
+    # every statement through create_all; several times faster per fresh engine.
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.executescript(_schema_script())
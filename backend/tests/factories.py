@@ -0,0 +1,94 @@
+import itertools
+import uuid
+from types import MappingProxyType
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.auth.jwt import hash_password
+from backend.db.models import Client, Instrument
+
+
+_uuid_counter = itertools.count(1)
+
+
+def next_uuid() -> uuid.UUID:
+    # Sequential ids: no urandom syscall, and stable across runs once the counter is reset per test.
+    return uuid.UUID(int=next(_uuid_counter))
+
+
+def reset_uuid_counter() -> None:
+    global _uuid_counter
+    _uuid_counter = itertools.count(1)
+
+
+# pbkdf2 is deliberately slow; no test checks the password, so hash it once per session.
+HASHED_SECRET = hash_password("secret")
+
+CLIENT_DEFAULTS = MappingProxyType(
+    {
+        "broker_type": "ibkr",
+        "encrypted_creds": "enc",
+        "mode": "confirmation",
+        "tier": "basic",
+        "is_active": True,
+    }
+)
+
+ES_INSTRUMENT_KW = MappingProxyType(
+    {
+        "symbol": "ES",
+        "asset_class": "future",
+        "exchange": "CME",
+        "currency": "USD",
+        "multiplier": 50.0,
+        "tick_size": 0.25,
+        "contract_rules": {},
+        "aliases": ["silver"],
+        "is_active": True,
+    }
+)
+
+# One long ES futures-option leg: enough net delta for the agent to propose a hedge.
+ES_FOP_POSITION = MappingProxyType(
+    {"symbol": "ES", "instrument_type": "FOP", "qty": 1, "delta": 1.0, "gamma": 0.0, "theta": 0.0, "vega": 0.0}
+)
+ES_FOP_POSITIONS = (ES_FOP_POSITION,)
+
+
+def make_client(*, email: str, **overrides: Any) -> Client:
+    fields: dict[str, Any] = {
+        **CLIENT_DEFAULTS,
+        "id": next_uuid(),
+        "email": email,
+        "hashed_password": HASHED_SECRET,
+        "risk_params": {"delta_threshold": 0.2},
+    }
+    fields.update(overrides)
+    return Client(**fields)
+
+
+async def seed_clients(db: AsyncSession, count: int, **overrides: Any) -> list[uuid.UUID]:
+    # One executemany INSERT instead of a unit-of-work flush per Client; the rows are not loaded
+    # into the session, so callers that need objects should use make_client instead.
+    rows = [
+        {
+            **CLIENT_DEFAULTS,
+            "id": next_uuid(),
+            "email": f"seed-{index}@example.com",
+            "hashed_password": HASHED_SECRET,
+            "risk_params": {},
+            **overrides,
+        }
+        for index in range(count)
+    ]
+    await db.execute(insert(Client), rows)
+    return [row["id"] for row in rows]
+
+
+def make_es_instrument(**overrides: Any) -> Instrument:
+    # Copy the mutable JSON columns so rows never share them.
+    fields = {**ES_INSTRUMENT_KW, "contract_rules": {}, "aliases": ["silver"]}
+    fields.update(overrides)
+    return Instrument(**fields)
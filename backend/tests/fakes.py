@@ -0,0 +1,38 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class FakeRedis:
+    __slots__ = ("set_calls", "publish_calls")
+
+    def __init__(self) -> None:
+        self.set_calls: list[tuple[str, str, int | None]] = []
+        self.publish_calls: list[tuple[str, str]] = []
+
+    def clear(self) -> None:
+        self.set_calls.clear()
+        self.publish_calls.clear()
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.set_calls.append((key, value, ex))
+
+    async def publish(self, channel: str, payload: str) -> None:
+        self.publish_calls.append((channel, payload))
+
+
+# FastAPI runs sync dependencies in the threadpool; overrides built here stay coroutines so they
+# resolve inline on the event loop like the real get_current_client / get_db_session.
+def async_const(value: T) -> Callable[[], Awaitable[T]]:
+    async def _dependency() -> T:
+        return value
+
+    return _dependency
+
+
+def async_yield(value: Any) -> Callable[[], AsyncIterator[Any]]:
+    async def _dependency() -> AsyncIterator[Any]:
+        yield value
+
+    return _dependency
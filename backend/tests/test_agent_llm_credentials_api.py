@@ -1,13 +1,30 @@
-import uuid
 from types import SimpleNamespace
 
+import orjson
 import pytest
 from fastapi import FastAPI
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
 from backend.api import agent as agent_api
 from backend.api.deps import get_current_client
 from backend.db.session import get_db_session
+from backend.tests.factories import next_uuid
+from backend.tests.fakes import async_const, async_yield
+
+
+# Shared like the lru_cached get_settings() they stand in for.
+_SETTINGS_ENV_KEYS = SimpleNamespace(
+    openai_api_key="",
+    anthropic_api_key="env-anthropic",
+    openrouter_api_key="env-openrouter",
+    xai_api_key="",
+)
+_SETTINGS_NO_KEYS = SimpleNamespace(
+    openai_api_key="",
+    anthropic_api_key="",
+    openrouter_api_key="",
+    xai_api_key="",
+)
 
 
 class _StubDbSession:
@@ -18,26 +35,15 @@ class _StubDbSession:
         self.commit_count += 1
 
 
-@pytest.mark.asyncio
 async def test_get_llm_credentials_status_uses_client_and_env_sources(monkeypatch: pytest.MonkeyPatch) -> None:
-    client_id = uuid.uuid4()
-    app = FastAPI()
-    app.include_router(agent_api.router)
+    # Every dependency is supplied directly, so call the handler instead of going through ASGI.
+    client_id = next_uuid()
 
     current_client = SimpleNamespace(
         id=client_id,
         broker_type="ibkr",
         encrypted_creds="enc-1",
     )
-
-    async def override_current_client() -> SimpleNamespace:
-        return current_client
-
-    async def override_db_session():
-        yield _StubDbSession()
-
-    app.dependency_overrides[get_current_client] = override_current_client
-    app.dependency_overrides[get_db_session] = override_db_session
     monkeypatch.setattr(
         agent_api.vault,
         "decrypt",
@@ -49,33 +55,23 @@ async def test_get_llm_credentials_status_uses_client_and_env_sources(monkeypatc
             },
         },
     )
-    monkeypatch.setattr(
-        agent_api,
-        "get_settings",
-        lambda: SimpleNamespace(
-            openai_api_key="",
-            anthropic_api_key="env-anthropic",
-            openrouter_api_key="env-openrouter",
-            xai_api_key="",
-        ),
-    )
+    monkeypatch.setattr(agent_api, "get_settings", lambda: _SETTINGS_ENV_KEYS)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.get(f"/clients/{client_id}/agent/llm-credentials")
+    status = await agent_api.get_llm_credentials_status(id=client_id, current_client=current_client)
 
-    assert response.status_code == 200
-    payload = response.json()
+    payload = status.model_dump()
     assert payload["openai"] == {"configured": True, "source": "client"}
     assert payload["anthropic"] == {"configured": True, "source": "env"}
     assert payload["openrouter"] == {"configured": True, "source": "env"}
     assert payload["xai"] == {"configured": True, "source": "client"}
 
 
-@pytest.mark.asyncio
-async def test_update_llm_credentials_persists_into_encrypted_creds(monkeypatch: pytest.MonkeyPatch) -> None:
-    client_id = uuid.uuid4()
-    app = FastAPI()
-    app.include_router(agent_api.router)
+async def test_update_llm_credentials_persists_into_encrypted_creds(
+    app: FastAPI,
+    http: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client_id = next_uuid()
 
     current_client = SimpleNamespace(
         id=client_id,
@@ -85,14 +81,8 @@ async def test_update_llm_credentials_persists_into_encrypted_creds(monkeypatch:
     db_stub = _StubDbSession()
     encrypted_payloads: list[dict] = []
 
-    async def override_current_client() -> SimpleNamespace:
-        return current_client
-
-    async def override_db_session():
-        yield db_stub
-
-    app.dependency_overrides[get_current_client] = override_current_client
-    app.dependency_overrides[get_db_session] = override_db_session
+    app.dependency_overrides[get_current_client] = async_const(current_client)
+    app.dependency_overrides[get_db_session] = async_yield(db_stub)
     monkeypatch.setattr(
         agent_api.vault,
         "decrypt",
@@ -103,27 +93,18 @@ async def test_update_llm_credentials_persists_into_encrypted_creds(monkeypatch:
         "encrypt",
         lambda payload: encrypted_payloads.append(dict(payload)) or "enc-new",
     )
-    monkeypatch.setattr(
-        agent_api,
-        "get_settings",
-        lambda: SimpleNamespace(
-            openai_api_key="",
-            anthropic_api_key="",
-            openrouter_api_key="",
-            xai_api_key="",
-        ),
-    )
+    monkeypatch.setattr(agent_api, "get_settings", lambda: _SETTINGS_NO_KEYS)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.post(
-            f"/clients/{client_id}/agent/llm-credentials",
-            json={
-                "openai_api_key": " sk-openai ",
-                "anthropic_api_key": "sk-ant",
-            },
-        )
+    response = await http.post(
+        f"/clients/{client_id}/agent/llm-credentials",
+        content=orjson.dumps({"openai_api_key": " sk-openai ", "anthropic_api_key": "sk-ant"}),
+        headers={"content-type": "application/json"},
+    )
 
     assert response.status_code == 200
+    payload = orjson.loads(response.content)
+    assert payload["openai"] == {"configured": True, "source": "client"}
+    assert payload["anthropic"] == {"configured": True, "source": "client"}
     assert db_stub.commit_count == 1
     assert current_client.encrypted_creds == "enc-new"
     assert encrypted_payloads
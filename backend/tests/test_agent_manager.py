@@ -1,10 +1,15 @@
-import uuid
 from typing import Any
 
 import pytest
 
 from backend.agent.manager import AgentManager
 from backend.brokers.base import BrokerBase, BrokerOrderResult
+from backend.tests.factories import next_uuid
+
+
+_ZERO_GREEKS = {"delta": 0.0, "gamma": 0.0, "theta": 0.0, "vega": 0.0}
+_EMPTY_MARKET_DATA = {"underlying_price": 0.0, "iv_rank": 0.0, "iv_percentile": 0.0, "bid": 0.0, "ask": 0.0}
+_SUBMITTED_ORDER = BrokerOrderResult(order_id="OID", status="submitted", fill_price=None)
 
 
 class _FakeBroker(BrokerBase):
@@ -21,19 +26,16 @@ class _FakeBroker(BrokerBase):
     async def get_positions(self) -> list[dict[str, Any]]:
         return []
 
-    async def get_greeks(self, contract: dict[str, Any]) -> dict[str, float]:
-        del contract
-        return {"delta": 0.0, "gamma": 0.0, "theta": 0.0, "vega": 0.0}
+    async def get_greeks(self, contract: dict[str, Any]) -> dict[str, float]:  # noqa: ARG002
+        return _ZERO_GREEKS
 
-    async def get_options_chain(self, symbol: str, expiry: str | None = None) -> list[dict[str, Any]]:
-        del symbol, expiry
+    async def get_options_chain(self, symbol: str, expiry: str | None = None) -> list[dict[str, Any]]:  # noqa: ARG002
         return []
 
-    async def get_market_data(self, symbol: str) -> dict[str, float]:
-        del symbol
-        return {"underlying_price": 0.0, "iv_rank": 0.0, "iv_percentile": 0.0, "bid": 0.0, "ask": 0.0}
+    async def get_market_data(self, symbol: str) -> dict[str, float]:  # noqa: ARG002
+        return _EMPTY_MARKET_DATA
 
-    async def submit_order(
+    async def submit_order(  # noqa: ARG002
         self,
         contract: dict[str, Any],
         action: str,
@@ -41,27 +43,23 @@ class _FakeBroker(BrokerBase):
         order_type: str,
         limit_price: float | None = None,
     ) -> BrokerOrderResult:
-        del contract, action, qty, order_type, limit_price
-        return BrokerOrderResult(order_id="OID", status="submitted", fill_price=None)
+        return _SUBMITTED_ORDER
 
-    async def stream_greeks(self, callback):  # noqa: ANN001
-        del callback
+    async def stream_greeks(self, callback):  # noqa: ANN001, ARG002
         return None
 
 
-@pytest.mark.asyncio
 async def test_force_recreate_disconnects_existing_broker(monkeypatch: pytest.MonkeyPatch) -> None:
     created: list[_FakeBroker] = []
 
-    def _build_broker(**kwargs: Any) -> _FakeBroker:
-        del kwargs
+    def _build_broker(**_kwargs: Any) -> _FakeBroker:
         broker = _FakeBroker()
         created.append(broker)
         return broker
 
     monkeypatch.setattr("backend.agent.manager.build_broker", _build_broker)
     manager = AgentManager()
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
 
     await manager.get_agent(
         client_id=client_id,
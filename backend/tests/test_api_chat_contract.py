@@ -1,13 +1,16 @@
 import uuid
 from types import SimpleNamespace
 
+import orjson
 import pytest
 from fastapi import FastAPI
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
 from backend.api import agent as agent_api
 from backend.api.deps import get_current_client
 from backend.db.session import get_db_session
+from backend.tests.factories import next_uuid
+from backend.tests.fakes import async_const, async_yield
 
 
 class _FakeAgent:
@@ -57,32 +60,32 @@ class _FakeManager:
         return _FakeAgent()
 
 
-@pytest.mark.asyncio
-async def test_chat_endpoint_response_contract(monkeypatch: pytest.MonkeyPatch) -> None:
-    client_id = uuid.uuid4()
-    app = FastAPI()
-    app.include_router(agent_api.router)
+async def test_chat_endpoint_response_contract(
+    app: FastAPI,
+    http: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client_id = next_uuid()
     app.state.agent_manager = _FakeManager()
 
-    async def override_current_client() -> SimpleNamespace:
-        return SimpleNamespace(
+    app.dependency_overrides[get_current_client] = async_const(
+        SimpleNamespace(
             id=client_id,
             broker_type="ibkr",
             encrypted_creds="encrypted-creds",
         )
-
-    async def override_db_session():
-        yield None
-
-    app.dependency_overrides[get_current_client] = override_current_client
-    app.dependency_overrides[get_db_session] = override_db_session
+    )
+    app.dependency_overrides[get_db_session] = async_yield(None)
     monkeypatch.setattr(agent_api.vault, "decrypt", lambda _ciphertext: {})
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.post(f"/clients/{client_id}/agent/chat", json={"message": "hedge delta"})
+    response = await http.post(
+        f"/clients/{client_id}/agent/chat",
+        content=orjson.dumps({"message": "hedge delta"}),
+        headers={"content-type": "application/json"},
+    )
 
     assert response.status_code == 200
-    payload = response.json()
+    payload = orjson.loads(response.content)
     assert payload["tool_trace_id"] == "trace-42"
     assert isinstance(payload["planned_tools"], list)
     assert isinstance(payload["tool_calls"], list)
@@ -93,44 +96,41 @@ async def test_chat_endpoint_response_contract(monkeypatch: pytest.MonkeyPatch)
     assert payload["tool_results"][0]["output"]["net_greeks"]["delta"] == 0.5
 
 
-@pytest.mark.asyncio
-async def test_readiness_endpoint_response_contract(monkeypatch: pytest.MonkeyPatch) -> None:
-    client_id = uuid.uuid4()
-    app = FastAPI()
-    app.include_router(agent_api.router)
+async def test_readiness_endpoint_response_contract(
+    app: FastAPI,
+    http: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client_id = next_uuid()
     app.state.agent_manager = _FakeManager()
 
-    async def override_current_client() -> SimpleNamespace:
-        return SimpleNamespace(
+    app.dependency_overrides[get_current_client] = async_const(
+        SimpleNamespace(
             id=client_id,
             broker_type="ibkr",
             encrypted_creds="encrypted-creds",
             mode="confirmation",
         )
-
-    async def override_db_session():
-        yield None
-
-    app.dependency_overrides[get_current_client] = override_current_client
-    app.dependency_overrides[get_db_session] = override_db_session
+    )
+    app.dependency_overrides[get_db_session] = async_yield(None)
     monkeypatch.setattr(agent_api.vault, "decrypt", lambda _ciphertext: {})
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.get(f"/clients/{client_id}/agent/readiness")
+    response = await http.get(f"/clients/{client_id}/agent/readiness")
 
     assert response.status_code == 200
-    payload = response.json()
+    payload = orjson.loads(response.content)
     assert payload["client_id"] == str(client_id)
     assert payload["connected"] is True
     assert payload["market_data_ok"] is True
     assert payload["ready"] is True
 
 
-@pytest.mark.asyncio
-async def test_client_can_fetch_emergency_halt_status(monkeypatch: pytest.MonkeyPatch) -> None:
-    client_id = uuid.uuid4()
-    app = FastAPI()
-    app.include_router(agent_api.router)
+async def test_client_can_fetch_emergency_halt_status(
+    app: FastAPI,
+    http: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client_id = next_uuid()
     app.state.agent_manager = _FakeManager()
     app.state.emergency_halt = SimpleNamespace(
         get=lambda: None
@@ -146,25 +146,20 @@ async def test_client_can_fetch_emergency_halt_status(monkeypatch: pytest.Monkey
 
     app.state.emergency_halt = SimpleNamespace(get=_get_halt_state)
 
-    async def override_current_client() -> SimpleNamespace:
-        return SimpleNamespace(
+    app.dependency_overrides[get_current_client] = async_const(
+        SimpleNamespace(
             id=client_id,
             broker_type="ibkr",
             encrypted_creds="encrypted-creds",
             mode="confirmation",
         )
-
-    async def override_db_session():
-        yield None
-
-    app.dependency_overrides[get_current_client] = override_current_client
-    app.dependency_overrides[get_db_session] = override_db_session
+    )
+    app.dependency_overrides[get_db_session] = async_yield(None)
     monkeypatch.setattr(agent_api.vault, "decrypt", lambda _ciphertext: {})
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.get(f"/clients/{client_id}/agent/emergency-halt")
+    response = await http.get(f"/clients/{client_id}/agent/emergency-halt")
 
     assert response.status_code == 200
-    payload = response.json()
+    payload = orjson.loads(response.content)
     assert payload["halted"] is True
     assert payload["reason"] == "manual halt"
@@ -1,5 +1,9 @@
 import pytest
+import json
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
+from typing import Any
+from urllib.parse import urlsplit
 
 from backend.brokers.factory import build_broker
 from backend.brokers.ibkr import IBKRBroker
@@ -8,16 +12,12 @@ from backend.brokers.base import BrokerOrderError
 from backend.brokers.phillip import PhillipBroker
 
 
-@pytest.mark.asyncio
-async def test_factory_returns_mock_when_enabled() -> None:
+def test_factory_returns_mock_when_enabled() -> None:
     broker = build_broker("ibkr", use_mock=True)
     assert isinstance(broker, MockBroker)
 
 
-@pytest.mark.asyncio
-async def test_mock_broker_submit_order() -> None:
-    broker = MockBroker()
-    await broker.connect()
+async def test_mock_broker_submit_order(broker: MockBroker) -> None:
     result = await broker.submit_order(
         contract={"symbol": "ES", "instrument": "FOP"},
         action="BUY",
@@ -29,7 +29,9 @@ async def test_mock_broker_submit_order() -> None:
     assert result.order_id is not None
 
 
+# The IB fakes below only carry class-level attributes; empty __slots__ keeps their instances dict-free.
 class _FakeGreeks:
+    __slots__ = ()
     delta = 0.12
     gamma = 0.03
     theta = -0.08
@@ -37,6 +39,7 @@ class _FakeGreeks:
 
 
 class _FakeTicker:
+    __slots__ = ()
     modelGreeks = _FakeGreeks()
     bid = 10.0
     ask = 10.3
@@ -48,20 +51,24 @@ class _FakeTicker:
 
 
 class _FakeOrderStatus:
+    __slots__ = ()
     status = "Filled"
     avgFillPrice = 10.25
 
 
 class _FakeOrder:
+    __slots__ = ()
     orderId = 12345
 
 
 class _FakeTrade:
+    __slots__ = ()
     orderStatus = _FakeOrderStatus()
     order = _FakeOrder()
 
 
 class _FakePositionContract:
+    __slots__ = ()
     symbol = "ES"
     secType = "FOP"
     strike = 5000.0
@@ -73,12 +80,14 @@ class _FakePositionContract:
 
 
 class _FakePosition:
+    __slots__ = ()
     contract = _FakePositionContract()
     position = 1
     avgCost = 10.1
 
 
 class _FakeChain:
+    __slots__ = ()
     expirations = {"20260320"}
     strikes = {5000.0, 5050.0}
     exchange = "CME"
@@ -86,12 +95,24 @@ class _FakeChain:
 
 
 class _FakeContractDetails:
+    __slots__ = ()
+
     class contract:  # noqa: N801
         conId = 12345
         lastTradeDateOrContractMonth = "202603"
 
 
+# The fakes carry no per-instance state, so every IB call can hand out the same objects.
+_SHARED_TICKER = _FakeTicker()
+_SHARED_POSITION = _FakePosition()
+_SHARED_TRADE = _FakeTrade()
+_SHARED_CHAIN = _FakeChain()
+_SHARED_CONTRACT_DETAILS = _FakeContractDetails()
+
+
 class _FakeIB:
+    __slots__ = ("connected", "market_data_type")
+
     def __init__(self) -> None:
         self.connected = True
         self.market_data_type: int | None = None
@@ -100,19 +121,19 @@ class _FakeIB:
         return self.connected
 
     def positions(self):
-        return [_FakePosition()]
+        return [_SHARED_POSITION]
 
     async def reqTickersAsync(self, *args):
-        return [_FakeTicker() for _ in args] or [_FakeTicker()]
+        return [_SHARED_TICKER] * (len(args) or 1)
 
     async def reqSecDefOptParamsAsync(self, *args):
-        return [_FakeChain()]
+        return [_SHARED_CHAIN]
 
     async def reqContractDetailsAsync(self, *args):
-        return [_FakeContractDetails()]
+        return [_SHARED_CONTRACT_DETAILS]
 
     def placeOrder(self, contract, order):
-        return _FakeTrade()
+        return _SHARED_TRADE
 
     def reqMarketDataType(self, market_data_type: int):  # noqa: N802
         self.market_data_type = market_data_type
@@ -129,18 +150,27 @@ class _FakeIBClientIdCollision:
         return True
 
 
-@pytest.mark.asyncio
-async def test_ibkr_submit_order_with_fake_ib() -> None:
-    broker = IBKRBroker()
-    broker._ib = _FakeIB()
-    broker._connected = True
-    broker._build_contract = lambda payload: payload  # type: ignore[method-assign]
-    broker._build_order = lambda action, qty, order_type, limit_price: {  # type: ignore[method-assign]
-        "action": action,
-        "qty": qty,
-        "order_type": order_type,
-        "limit_price": limit_price,
-    }
+def _echo_order(action: str, qty: int, order_type: str, limit_price: float | None) -> dict[str, Any]:
+    return {"action": action, "qty": qty, "order_type": order_type, "limit_price": limit_price}
+
+
+@pytest.fixture
+def stubbed_ibkr() -> Callable[..., IBKRBroker]:
+    # Connected IBKRBroker over a fake IB session, with contract/order building bypassed so tests
+    # never need ib_insync objects.
+    def _build(credentials: dict | None = None, ib: _FakeIB | None = None) -> IBKRBroker:
+        broker = IBKRBroker(credentials)
+        broker._ib = ib or _FakeIB()
+        broker._connected = True
+        broker._build_contract = lambda payload: payload  # type: ignore[method-assign]
+        broker._build_order = _echo_order  # type: ignore[method-assign]
+        return broker
+
+    return _build
+
+
+async def test_ibkr_submit_order_with_fake_ib(stubbed_ibkr: Callable[..., IBKRBroker]) -> None:
+    broker = stubbed_ibkr()
     result = await broker.submit_order(
         contract={"symbol": "ES", "instrument": "FOP", "expiry": "20260320", "strike": 5000, "right": "C"},
         action="BUY",
@@ -152,23 +182,15 @@ async def test_ibkr_submit_order_with_fake_ib() -> None:
     assert result.fill_price == 10.25
 
 
-@pytest.mark.asyncio
-async def test_ibkr_get_positions_enriches_greeks() -> None:
-    broker = IBKRBroker()
-    broker._ib = _FakeIB()
-    broker._connected = True
-    broker._build_contract = lambda payload: payload  # type: ignore[method-assign]
+async def test_ibkr_get_positions_enriches_greeks(stubbed_ibkr: Callable[..., IBKRBroker]) -> None:
+    broker = stubbed_ibkr()
     rows = await broker.get_positions()
     assert len(rows) == 1
     assert rows[0]["delta"] == pytest.approx(0.12)
 
 
-@pytest.mark.asyncio
-async def test_ibkr_get_options_chain_returns_greek_rows() -> None:
-    broker = IBKRBroker({"max_chain_quotes": 2})
-    broker._ib = _FakeIB()
-    broker._connected = True
-    broker._build_contract = lambda payload: payload  # type: ignore[method-assign]
+async def test_ibkr_get_options_chain_returns_greek_rows(stubbed_ibkr: Callable[..., IBKRBroker]) -> None:
+    broker = stubbed_ibkr({"max_chain_quotes": 2})
     chain = await broker.get_options_chain("ES", "20260320")
     assert len(chain) == 2
     assert chain[0]["call_delta"] == pytest.approx(0.12)
@@ -182,65 +204,106 @@ def test_ibkr_pick_target_expiry_uses_nearest_available() -> None:
     assert picked == "20260320"
 
 
+# Canned Phillip API bodies, built once and handed out by reference; the broker only reads them.
+_TOKEN_PAYLOAD = {"access_token": "token-123", "expires_in": 3600}
+_ORDER_PAYLOAD = {"orderId": "OID-1", "status": "accepted", "fillPrice": 10.5}
+_POSITIONS_PAYLOAD = {
+    "positions": [
+        {
+            "symbol": "ES",
+            "instrumentType": "FOP",
+            "strike": 5000,
+            "expiry": "20260320",
+            "quantity": 2,
+            "delta": 0.1,
+            "gamma": 0.02,
+            "theta": -0.04,
+            "vega": 0.2,
+            "avgPrice": 10.0,
+        }
+    ]
+}
+_CHAIN_PAYLOAD = {"chain": [{"symbol": "ES", "strike": 5000}]}
+_MARKET_DATA_PAYLOAD = {"last": 5010, "ivRank": 40, "ivPercentile": 55, "bid": 10, "ask": 10.2}
+
+
 class _FakeHTTPResponse:
+    __slots__ = ("status_code", "_payload", "_text")
+
     def __init__(self, status_code: int, payload: dict, text: str = "") -> None:
         self.status_code = status_code
         self._payload = payload
-        self.text = text or str(payload)
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        # Rendered on demand: the broker only reads the body when it builds an error message.
+        return self._text or json.dumps(self._payload)
 
     def json(self) -> dict:
         return self._payload
 
 
+# Responses are immutable from the broker's point of view, so each route hands out one shared instance.
+_NOT_FOUND = _FakeHTTPResponse(404, {}, text="not found")
+_TEMPORARY = _FakeHTTPResponse(503, {"error": "temporary"}, text="temporary")
+_POSITIONS = _FakeHTTPResponse(200, _POSITIONS_PAYLOAD)
+_POST_ROUTES = {
+    "/oauth/token": _FakeHTTPResponse(200, _TOKEN_PAYLOAD),
+    "/orders": _FakeHTTPResponse(200, _ORDER_PAYLOAD),
+}
+_GET_ROUTES = {
+    "/positions": _POSITIONS,
+    "/options/chain": _FakeHTTPResponse(200, _CHAIN_PAYLOAD),
+    "/market-data/ES": _FakeHTTPResponse(200, _MARKET_DATA_PAYLOAD),
+}
+
+
+def _route(routes: dict[str, _FakeHTTPResponse], url: str) -> _FakeHTTPResponse:
+    # Match the URL path suffix, so a longer or different path (e.g. /orders/1/cancel) falls through to 404.
+    path = urlsplit(url).path
+    return next((response for suffix, response in routes.items() if path.endswith(suffix)), _NOT_FOUND)
+
+
 class _FakeAsyncHTTPClient:
     def __init__(self) -> None:
         self.calls: list[tuple[str, str]] = []
         self.transient_positions_failures = 0
+        self._handlers = {"POST": self.post, "GET": self.get}
 
-    async def request(self, method: str, url: str, data=None, json=None, params=None, headers=None):  # noqa: ANN001
-        method = method.upper()
-        if method == "POST":
-            return await self.post(url, data=data, json=json, headers=headers)
-        return await self.get(url, params=params, headers=headers)
+    async def request(  # noqa: ARG002
+        self, method: str, url: str, data=None, json=None, params=None, headers=None  # noqa: ANN001
+    ):
+        # PhillipBroker upper-cases the verb itself, so the handler is a direct lookup.
+        return await self._handlers[method](url)
 
     async def post(self, url: str, data=None, json=None, headers=None):  # noqa: ANN001
         self.calls.append(("POST", url))
-        if url.endswith("/oauth/token"):
-            return _FakeHTTPResponse(200, {"access_token": "token-123", "expires_in": 3600})
-        if url.endswith("/orders"):
-            return _FakeHTTPResponse(200, {"orderId": "OID-1", "status": "accepted", "fillPrice": 10.5})
-        return _FakeHTTPResponse(404, {}, text="not found")
+        return _route(_POST_ROUTES, url)
 
     async def get(self, url: str, params=None, headers=None):  # noqa: ANN001
         self.calls.append(("GET", url))
-        if url.endswith("/positions"):
-            if self.transient_positions_failures > 0:
-                self.transient_positions_failures -= 1
-                return _FakeHTTPResponse(503, {"error": "temporary"}, text="temporary")
-            return _FakeHTTPResponse(
-                200,
-                {
-                    "positions": [
-                        {
-                            "symbol": "ES",
-                            "instrumentType": "FOP",
-                            "strike": 5000,
-                            "expiry": "20260320",
-                            "quantity": 2,
-                            "delta": 0.1,
-                            "gamma": 0.02,
-                            "theta": -0.04,
-                            "vega": 0.2,
-                            "avgPrice": 10.0,
-                        }
-                    ]
-                },
-            )
-        if "/options/chain" in url:
-            return _FakeHTTPResponse(200, {"chain": [{"symbol": "ES", "strike": 5000}]})
-        if "/market-data/" in url:
-            return _FakeHTTPResponse(200, {"last": 5010, "ivRank": 40, "ivPercentile": 55, "bid": 10, "ask": 10.2})
-        return _FakeHTTPResponse(404, {}, text="not found")
+        response = _route(_GET_ROUTES, url)
+        if response is _POSITIONS and self.transient_positions_failures > 0:
+            self.transient_positions_failures -= 1
+            return _TEMPORARY
+        return response
+
+
+_FIXED_NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):  # noqa: ANN001, ANN206
+        return _FIXED_NOW if tz is None else _FIXED_NOW.astimezone(tz)
+
+
+@pytest.fixture
+def frozen_phillip_clock(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    # Token expiry is computed from datetime.now(); pin it so expiry checks never race the wall clock.
+    monkeypatch.setattr("backend.brokers.phillip.datetime", _FrozenDatetime)
+    return _FIXED_NOW
 
 
 class _FailingAsyncHTTPClient:
@@ -248,7 +311,6 @@ class _FailingAsyncHTTPClient:
         raise RuntimeError("network down")
 
 
-@pytest.mark.asyncio
 async def test_phillip_auth_positions_and_order_mapping() -> None:
     broker = PhillipBroker({"client_id": "cid", "client_secret": "secret"})
     broker._http = _FakeAsyncHTTPClient()  # type: ignore[assignment]
@@ -281,8 +343,7 @@ async def test_phillip_auth_positions_and_order_mapping() -> None:
     assert order.status == "accepted"
 
 
-@pytest.mark.asyncio
-async def test_phillip_retries_transient_position_errors() -> None:
+async def test_phillip_retries_transient_position_errors(frozen_phillip_clock: datetime) -> None:
     broker = PhillipBroker({"client_id": "cid", "client_secret": "secret", "request_retries": 3})
     fake_http = _FakeAsyncHTTPClient()
     fake_http.transient_positions_failures = 1
@@ -294,12 +355,11 @@ async def test_phillip_retries_transient_position_errors() -> None:
     assert len(position_gets) >= 2
 
 
-@pytest.mark.asyncio
-async def test_phillip_retry_exhaustion_includes_failure_telemetry() -> None:
+async def test_phillip_retry_exhaustion_includes_failure_telemetry(frozen_phillip_clock: datetime) -> None:
     broker = PhillipBroker({"client_id": "cid", "client_secret": "secret", "request_retries": 2})
     broker._http = _FailingAsyncHTTPClient()  # type: ignore[assignment]
     broker._token = "token-123"
-    broker._token_expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    broker._token_expires_at = frozen_phillip_clock + timedelta(minutes=5)
 
     with pytest.raises(BrokerOrderError) as exc:
         await broker.get_positions()
@@ -310,40 +370,36 @@ async def test_phillip_retry_exhaustion_includes_failure_telemetry() -> None:
     assert exc.value.context["last_error_type"] == "RuntimeError"
 
 
-def test_ibkr_contract_normalization_with_alias_and_exchange_override() -> None:
-    broker = IBKRBroker({"exchange_overrides": {"YM": "CBOT"}})
-    normalized = broker._normalize_contract_payload(
-        {"symbol": "ym", "instrument": "future", "expiry": "202603", "right": "put"}
-    )
-    assert normalized["symbol"] == "YM"
-    assert normalized["instrument"] == "FUT"
-    assert normalized["exchange"] == "CBOT"
-    assert normalized["right"] == "P"
-
-
-def test_ibkr_contract_normalization_maps_exchange_alias_and_expiry_digits() -> None:
-    broker = IBKRBroker()
-    normalized = broker._normalize_contract_payload(
-        {"symbol": "es", "instrument": "fop", "expiry": "2026-03-20", "exchange": "globex", "right": "call"}
-    )
-    assert normalized["exchange"] == "CME"
-    assert normalized["expiry"] == "20260320"
-    assert normalized["right"] == "C"
+@pytest.mark.parametrize(
+    ("credentials", "payload", "expected"),
+    [
+        pytest.param(
+            {"exchange_overrides": {"YM": "CBOT"}},
+            {"symbol": "ym", "instrument": "future", "expiry": "202603", "right": "put"},
+            {"symbol": "YM", "instrument": "FUT", "exchange": "CBOT", "right": "P"},
+            id="alias-and-exchange-override",
+        ),
+        pytest.param(
+            None,
+            {"symbol": "es", "instrument": "fop", "expiry": "2026-03-20", "exchange": "globex", "right": "call"},
+            {"exchange": "CME", "expiry": "20260320", "right": "C"},
+            id="exchange-alias-and-expiry-digits",
+        ),
+    ],
+)
+def test_ibkr_contract_normalization(credentials: dict | None, payload: dict, expected: dict) -> None:
+    normalized = IBKRBroker(credentials)._normalize_contract_payload(payload)
+    assert {key: normalized[key] for key in expected} == expected
 
 
 class _FakeIBOptionsPartial(_FakeIB):
     async def reqTickersAsync(self, *args):
-        if len(args) == 2:
-            return [_FakeTicker()]
-        return [_FakeTicker()]
+        # Always one ticker, however many contracts were requested.
+        return [_SHARED_TICKER]
 
 
-@pytest.mark.asyncio
-async def test_ibkr_options_chain_handles_partial_ticker_responses() -> None:
-    broker = IBKRBroker({"max_chain_quotes": 1})
-    broker._ib = _FakeIBOptionsPartial()
-    broker._connected = True
-    broker._build_contract = lambda payload: payload  # type: ignore[method-assign]
+async def test_ibkr_options_chain_handles_partial_ticker_responses(stubbed_ibkr: Callable[..., IBKRBroker]) -> None:
+    broker = stubbed_ibkr({"max_chain_quotes": 1}, ib=_FakeIBOptionsPartial())
 
     chain = await broker.get_options_chain("ES", "20260320")
 
@@ -352,13 +408,10 @@ async def test_ibkr_options_chain_handles_partial_ticker_responses() -> None:
     assert chain[0]["put_delta"] == pytest.approx(0.0)
 
 
-@pytest.mark.asyncio
-async def test_ibkr_ensure_connected_reconnects_dropped_session() -> None:
-    broker = IBKRBroker()
-    fake_ib = _FakeIB()
-    fake_ib.connected = False
-    broker._ib = fake_ib
-    broker._connected = True
+async def test_ibkr_ensure_connected_reconnects_dropped_session(stubbed_ibkr: Callable[..., IBKRBroker]) -> None:
+    dropped_ib = _FakeIB()
+    dropped_ib.connected = False
+    broker = stubbed_ibkr(ib=dropped_ib)
 
     called = {"count": 0}
 
@@ -384,7 +437,6 @@ def test_ibkr_sets_delayed_market_data_type_when_enabled() -> None:
     assert fake_ib.market_data_type == 3
 
 
-@pytest.mark.asyncio
 async def test_ibkr_connect_with_retry_uses_next_client_id_when_collision() -> None:
     broker = IBKRBroker({"client_id": 12, "connect_retries": 1, "client_id_fallback_attempts": 3})
     fake_ib = _FakeIBClientIdCollision()
@@ -2,30 +2,20 @@ import uuid
 
 import pytest
 from fastapi import FastAPI
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.api import clients as clients_api
-from backend.db.models import Base, Client
+from backend.db.models import Client
 from backend.db.session import get_db_session
+from backend.tests.fakes import async_yield
 
 
-@pytest.mark.asyncio
-async def test_onboard_persists_default_execution_alert_thresholds() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    app = FastAPI()
-    app.include_router(clients_api.router)
-
-    async def override_db_session():
-        async with session_maker() as db:
-            yield db
-
-    app.dependency_overrides[get_db_session] = override_db_session
+async def test_onboard_persists_default_execution_alert_thresholds(
+    app: FastAPI,
+    http: AsyncClient,
+    db: AsyncSession,
+) -> None:
+    app.dependency_overrides[get_db_session] = async_yield(db)
 
     payload = {
         "email": "defaults-onboard@example.com",
@@ -35,8 +25,7 @@ async def test_onboard_persists_default_execution_alert_thresholds() -> None:
         "risk_parameters": {"delta_threshold": 0.35, "max_size": 12},
         "subscription_tier": "basic",
     }
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.post("/clients/onboard", json=payload)
+    response = await http.post("/clients/onboard", json=payload)
 
     assert response.status_code == 200
     body = response.json()
@@ -58,10 +47,7 @@ async def test_onboard_persists_default_execution_alert_thresholds() -> None:
     assert risk["auto_remediation_cooldown_minutes"] == 20
     assert risk["auto_remediation_max_actions_per_hour"] == 2
 
-    async with session_maker() as db:
-        client_id = uuid.UUID(body["id"])
-        client = await db.get(Client, client_id)
-        assert client is not None
-        assert client.risk_params["execution_alert_latency_warn_ms"] == 3000
-
-    await engine.dispose()
+    # populate_existing re-SELECTs the row instead of returning the object the route left in the session.
+    client = await db.get(Client, uuid.UUID(body["id"]), populate_existing=True)
+    assert client is not None
+    assert client.risk_params["execution_alert_latency_warn_ms"] == 3000
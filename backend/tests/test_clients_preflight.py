@@ -1,13 +1,15 @@
-import uuid
 from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import FastAPI
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
 from backend.api import clients as clients_api
 from backend.api.deps import get_current_client
 from backend.db.session import get_db_session
+from backend.tests.factories import next_uuid
+from backend.tests.fakes import async_const, async_yield
 
 
 class _FakeBroker:
@@ -25,34 +27,34 @@ class _FakeManager:
         return _FakeAgent()
 
 
-@pytest.mark.asyncio
-async def test_ibkr_preflight_success(monkeypatch: pytest.MonkeyPatch) -> None:
-    client_id = uuid.uuid4()
-    app = FastAPI()
-    app.include_router(clients_api.router)
-    app.state.agent_manager = _FakeManager()
+def _preflight_request() -> SimpleNamespace:
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(agent_manager=_FakeManager())))
+
 
-    async def override_current_client() -> SimpleNamespace:
-        return SimpleNamespace(
+async def test_ibkr_preflight_success(
+    app: FastAPI,
+    http: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client_id = next_uuid()
+    app.state.agent_manager = _FakeManager()
+    app.dependency_overrides[get_current_client] = async_const(
+        SimpleNamespace(
             id=client_id,
             broker_type="ibkr",
             encrypted_creds="encrypted-creds",
         )
-
-    async def override_db_session():
-        yield None
-
-    app.dependency_overrides[get_current_client] = override_current_client
-    app.dependency_overrides[get_db_session] = override_db_session
+    )
+    app.dependency_overrides[get_db_session] = async_yield(None)
     monkeypatch.setattr(
         clients_api.vault,
         "decrypt",
         lambda _cipher: {"host": "localhost", "port": 4002, "client_id": 11, "underlying_instrument": "IND"},
     )
-    monkeypatch.setattr(clients_api, "_check_tcp", lambda *_args, **_kwargs: _true())
+    check_tcp = AsyncMock(return_value=True)
+    monkeypatch.setattr(clients_api, "_check_tcp", check_tcp)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.post(f"/clients/{client_id}/broker/preflight")
+    response = await http.post(f"/clients/{client_id}/broker/preflight")
 
     assert response.status_code == 200
     payload = response.json()
@@ -62,80 +64,50 @@ async def test_ibkr_preflight_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert keys["host"]["status"] == "pass"
     assert keys["port"]["status"] == "pass"
     assert keys["socket"]["status"] == "pass"
+    check_tcp.assert_awaited_once_with("localhost", 4002)
     assert keys["market_data"]["status"] == "pass"
 
 
-@pytest.mark.asyncio
+# The success case above is the end-to-end check; the failure cases call the handler directly.
 async def test_ibkr_preflight_fails_when_socket_unreachable(monkeypatch: pytest.MonkeyPatch) -> None:
-    client_id = uuid.uuid4()
-    app = FastAPI()
-    app.include_router(clients_api.router)
-    app.state.agent_manager = _FakeManager()
-
-    async def override_current_client() -> SimpleNamespace:
-        return SimpleNamespace(
-            id=client_id,
-            broker_type="ibkr",
-            encrypted_creds="encrypted-creds",
-        )
-
-    async def override_db_session():
-        yield None
-
-    app.dependency_overrides[get_current_client] = override_current_client
-    app.dependency_overrides[get_db_session] = override_db_session
+    client_id = next_uuid()
+    current_client = SimpleNamespace(id=client_id, broker_type="ibkr", encrypted_creds="encrypted-creds")
     monkeypatch.setattr(
         clients_api.vault,
         "decrypt",
         lambda _cipher: {"host": "localhost", "port": 4002, "client_id": 11, "underlying_instrument": "IND"},
     )
-    monkeypatch.setattr(clients_api, "_check_tcp", lambda *_args, **_kwargs: _false())
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.post(f"/clients/{client_id}/broker/preflight")
+    check_tcp = AsyncMock(return_value=False)
+    monkeypatch.setattr(clients_api, "_check_tcp", check_tcp)
+
+    result = await clients_api.preflight_broker(
+        id=client_id,
+        request=_preflight_request(),  # type: ignore[arg-type]
+        payload=None,
+        current_client=current_client,  # type: ignore[arg-type]
+        db=None,  # type: ignore[arg-type]
+    )
 
-    assert response.status_code == 200
-    payload = response.json()
-    assert payload["ok"] is False
-    assert any("Cannot reach IBKR gateway" in issue for issue in payload["blocking_issues"])
-    socket_check = next(check for check in payload["checks"] if check["key"] == "socket")
-    assert socket_check["status"] == "fail"
+    assert result.ok is False
+    assert any("Cannot reach IBKR gateway" in issue for issue in result.blocking_issues)
+    socket_check = next(check for check in result.checks if check.key == "socket")
+    assert socket_check.status == "fail"
+    check_tcp.assert_awaited_once_with("localhost", 4002)
 
 
-@pytest.mark.asyncio
 async def test_phillip_preflight_missing_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
-    client_id = uuid.uuid4()
-    app = FastAPI()
-    app.include_router(clients_api.router)
-    app.state.agent_manager = _FakeManager()
-
-    async def override_current_client() -> SimpleNamespace:
-        return SimpleNamespace(
-            id=client_id,
-            broker_type="phillip",
-            encrypted_creds="encrypted-creds",
-        )
-
-    async def override_db_session():
-        yield None
-
-    app.dependency_overrides[get_current_client] = override_current_client
-    app.dependency_overrides[get_db_session] = override_db_session
+    client_id = next_uuid()
+    current_client = SimpleNamespace(id=client_id, broker_type="phillip", encrypted_creds="encrypted-creds")
     monkeypatch.setattr(clients_api.vault, "decrypt", lambda _cipher: {})
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
-        response = await http.post(f"/clients/{client_id}/broker/preflight")
-
-    assert response.status_code == 200
-    payload = response.json()
-    assert payload["ok"] is False
-    assert "Phillip client_id is missing." in payload["blocking_issues"]
-    assert "Phillip client_secret is missing." in payload["blocking_issues"]
-
-
-async def _true() -> bool:
-    return True
-
+    result = await clients_api.preflight_broker(
+        id=client_id,
+        request=_preflight_request(),  # type: ignore[arg-type]
+        payload=None,
+        current_client=current_client,  # type: ignore[arg-type]
+        db=None,  # type: ignore[arg-type]
+    )
 
-async def _false() -> bool:
-    return False
+    assert result.ok is False
+    assert "Phillip client_id is missing." in result.blocking_issues
+    assert "Phillip client_secret is missing." in result.blocking_issues
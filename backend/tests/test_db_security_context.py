@@ -1,13 +1,13 @@
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-import pytest
-
 from backend.api.deps import _set_db_security_context
 from backend.db.session import reset_connection_security_context
 
 
 class _FakeCursor:
+    __slots__ = ("executed", "closed")
+
     def __init__(self) -> None:
         self.executed: list[str] = []
         self.closed = False
@@ -20,6 +20,8 @@ class _FakeCursor:
 
 
 class _FakeConnection:
+    __slots__ = ("cursor_obj",)
+
     def __init__(self) -> None:
         self.cursor_obj = _FakeCursor()
 
@@ -27,7 +29,6 @@ class _FakeConnection:
         return self.cursor_obj
 
 
-@pytest.mark.asyncio
 async def test_set_db_security_context_sets_postgres_session_vars() -> None:
     db = SimpleNamespace(
         get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="postgresql")),
@@ -45,7 +46,6 @@ async def test_set_db_security_context_sets_postgres_session_vars() -> None:
     assert second_params == {"is_admin": "true"}
 
 
-@pytest.mark.asyncio
 async def test_set_db_security_context_noop_for_non_postgres() -> None:
     db = SimpleNamespace(
         get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="sqlite")),
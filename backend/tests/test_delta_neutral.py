@@ -0,0 +1,34 @@
+import pytest
+
+from backend.strategies.delta_neutral import _ZERO_GREEKS, detect_rebalance_need
+from backend.tests.factories import ES_FOP_POSITION
+
+
+def test_flat_portfolio_returns_shared_zero_greeks() -> None:
+    result = detect_rebalance_need([], 0.2)
+
+    assert result["needs_rebalance"] is False
+    assert result["net_delta"] == 0.0
+    assert result["greeks"] is _ZERO_GREEKS
+
+
+@pytest.mark.parametrize(
+    ("qty", "delta_threshold", "needs_rebalance"),
+    [(1, 0.2, True), (1, 1.0, False), (-2, 1.5, True)],
+    ids=["above-threshold", "at-threshold", "short-above-threshold"],
+)
+def test_single_position_scales_greeks_by_qty(qty: int, delta_threshold: float, needs_rebalance: bool) -> None:
+    position = {**ES_FOP_POSITION, "qty": qty, "gamma": 0.5, "theta": -0.25, "vega": 2.0}
+
+    result = detect_rebalance_need([position], delta_threshold)
+
+    assert result["needs_rebalance"] is needs_rebalance
+    assert result["net_delta"] == qty
+    assert result["greeks"] == {"delta": qty, "gamma": 0.5 * qty, "theta": -0.25 * qty, "vega": 2.0 * qty}
+
+
+def test_multiple_positions_net_out() -> None:
+    result = detect_rebalance_need([ES_FOP_POSITION, {**ES_FOP_POSITION, "qty": -1}], 0.2)
+
+    assert result["needs_rebalance"] is False
+    assert result["net_delta"] == 0.0
@@ -1,24 +1,24 @@
-import uuid
 from types import SimpleNamespace
 
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.agent.core import TradingAgent
 from backend.agent.memory import AgentMemoryStore
 from backend.agent.risk import RiskGovernor
 from backend.api.deps import require_admin_access
 from backend.api.admin import set_emergency_halt
-from backend.auth.jwt import create_admin_token, hash_password
+from backend.auth.jwt import create_admin_token
 from backend.brokers.mock import MockBroker
 from backend.config import get_settings
-from backend.db.models import AuditLog, Base, Client, Proposal
+from backend.db.models import AuditLog, Proposal
 from backend.schemas import EmergencyHaltRequest
 from backend.safety.emergency_halt import EmergencyHaltController
+from backend.tests.apps import create_test_app
+from backend.tests.factories import make_client, make_es_instrument, seed_clients
 
 
 def test_admin_key_required_for_emergency_halt_access() -> None:
@@ -41,10 +41,9 @@ def test_admin_session_login_returns_bearer_token() -> None:
     previous = settings.admin_api_key
     settings.admin_api_key = "expected-admin-key"
     try:
-        app = FastAPI()
         from backend.api import admin as admin_api
 
-        app.include_router(admin_api.router)
+        app = create_test_app(admin_api.router)
         with TestClient(app) as client:
             response = client.post("/admin/session/login", json={"admin_key": "expected-admin-key"})
             assert response.status_code == 200
@@ -56,103 +55,60 @@ def test_admin_session_login_returns_bearer_token() -> None:
         settings.admin_api_key = previous
 
 
-@pytest.mark.asyncio
-async def test_emergency_halt_endpoint_writes_audit_rows() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with session_maker() as db:
-        c1 = Client(
-            id=uuid.uuid4(),
-            email="a@example.com",
-            hashed_password=hash_password("secret"),
-            broker_type="ibkr",
-            encrypted_creds="enc",
-            risk_params={},
-            mode="confirmation",
-            tier="basic",
-            is_active=True,
-        )
-        c2 = Client(
-            id=uuid.uuid4(),
-            email="b@example.com",
-            hashed_password=hash_password("secret"),
-            broker_type="ibkr",
-            encrypted_creds="enc",
-            risk_params={},
-            mode="confirmation",
-            tier="basic",
-            is_active=True,
-        )
-        db.add_all([c1, c2])
-        await db.commit()
-
-        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(emergency_halt=EmergencyHaltController())))
-        response = await set_emergency_halt(
-            payload=EmergencyHaltRequest(halted=True, reason="manual kill switch"),
-            request=request,  # type: ignore[arg-type]
-            admin_actor="admin",
-            db=db,
-        )
-
-        assert response.halted is True
-        assert response.reason == "manual kill switch"
-        rows = await db.execute(select(AuditLog).where(AuditLog.event_type == "emergency_halt_updated"))
-        events = rows.scalars().all()
-        assert len(events) == 2
-        for event in events:
-            assert event.details["halted"] is True
-            assert event.details["reason"] == "manual kill switch"
-            assert event.details["updated_by"] == "admin"
-            assert isinstance(event.details["updated_at"], str)
-
-
-@pytest.mark.asyncio
-async def test_emergency_halt_blocks_proposal_approval_execution() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with session_maker() as db:
-        client_id = uuid.uuid4()
-        db.add(
-            Client(
-                id=client_id,
-                email="halted@example.com",
-                hashed_password=hash_password("secret"),
-                broker_type="ibkr",
-                encrypted_creds="enc",
-                risk_params={"delta_threshold": 10.0},
-                mode="confirmation",
-                tier="basic",
-                is_active=True,
-            )
-        )
-        await db.commit()
-
-        proposal = Proposal(
-            client_id=client_id,
-            trade_payload={"action": "BUY", "symbol": "ES", "instrument": "FOP", "qty": 1, "order_type": "MKT"},
-            agent_reasoning="test",
-            status="pending",
-        )
-        db.add(proposal)
-        await db.commit()
-        await db.refresh(proposal)
-
-        broker = MockBroker()
-        await broker.connect()
-        risk = RiskGovernor()
-        risk._is_market_hours = lambda _: True  # type: ignore[attr-defined]
-        controller = EmergencyHaltController()
+async def test_emergency_halt_endpoint_writes_audit_rows(db: AsyncSession) -> None:
+    await seed_clients(db, 2)
+    await db.commit()
+
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(emergency_halt=EmergencyHaltController())))
+    response = await set_emergency_halt(
+        payload=EmergencyHaltRequest(halted=True, reason="manual kill switch"),
+        request=request,  # type: ignore[arg-type]
+        admin_actor="admin",
+        db=db,
+    )
+
+    assert response.halted is True
+    assert response.reason == "manual kill switch"
+    rows = await db.execute(select(AuditLog).where(AuditLog.event_type == "emergency_halt_updated"))
+    events = rows.scalars().all()
+    assert len(events) == 2
+    for event in events:
+        assert event.details["halted"] is True
+        assert event.details["reason"] == "manual kill switch"
+        assert event.details["updated_by"] == "admin"
+        assert isinstance(event.details["updated_at"], str)
+
+
+@pytest.mark.parametrize("halted", [True, False], ids=["halted", "not-halted"])
+async def test_emergency_halt_blocks_proposal_approval_execution(
+    db: AsyncSession,
+    broker: MockBroker,
+    risk_governor: RiskGovernor,
+    halted: bool,
+) -> None:
+    client = make_client(email="halted@example.com", risk_params={"delta_threshold": 10.0})
+    client_id = client.id
+    proposal = Proposal(
+        client_id=client_id,
+        trade_payload={"action": "BUY", "symbol": "ES", "instrument": "FOP", "qty": 1, "order_type": "MKT"},
+        agent_reasoning="test",
+        status="pending",
+    )
+    db.add_all([client, make_es_instrument(), proposal])
+    await db.commit()
+    await db.refresh(proposal)
+
+    controller = EmergencyHaltController()
+    if halted:
         await controller.set(halted=True, reason="ops", updated_by="admin")
-        agent = TradingAgent(broker, db, AgentMemoryStore(), risk, emergency_halt=controller)
+    agent = TradingAgent(broker, db, AgentMemoryStore(), risk_governor, emergency_halt=controller)
 
+    if halted:
         with pytest.raises(ValueError, match="globally halted"):
             await agent.approve_proposal(client_id, proposal.id)
+    else:
+        execution = await agent.approve_proposal(client_id, proposal.id)
+        assert execution["order"]["status"] == "filled"
 
 
 class _FakeRedis:
@@ -166,7 +122,6 @@ class _FakeRedis:
         self._data[key] = value
 
 
-@pytest.mark.asyncio
 async def test_emergency_halt_state_persists_in_shared_store() -> None:
     fake_redis = _FakeRedis()
     writer = EmergencyHaltController(redis_client=fake_redis)  # type: ignore[arg-type]
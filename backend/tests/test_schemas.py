@@ -0,0 +1,41 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from backend.schemas import POSITION_LIST_ADAPTER, LoginRequest
+
+
+def _position_row(expiry: str | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1,
+        symbol="ES",
+        instrument_type="FUT",
+        strike=None,
+        expiry=expiry,
+        qty=1,
+        delta=1.0,
+        gamma=0.0,
+        theta=0.0,
+        vega=0.0,
+        avg_price=5000.0,
+        updated_at=datetime(2026, 3, 2, tzinfo=UTC),
+    )
+
+
+@pytest.mark.parametrize(
+    "expiry",
+    ["20260320", "", "202603", "MAR26", "2026-02-30", None],
+    ids=["compact-date", "stock-or-future", "contract-month", "month-code", "invalid-date", "missing"],
+)
+def test_position_out_keeps_broker_expiry_string(expiry: str | None) -> None:
+    # Broker expiries go out exactly as reported; the frontend renders the raw string.
+    (position,) = POSITION_LIST_ADAPTER.validate_python([_position_row(expiry)], from_attributes=True)
+    assert position.expiry == expiry
+    assert orjson.loads(POSITION_LIST_ADAPTER.dump_json([position]))[0]["expiry"] == expiry
+
+
+def test_email_is_normalized_like_email_str() -> None:
+    # Same result pydantic's EmailStr gives: surrounding whitespace dropped, domain lowercased.
+    assert LoginRequest(email=" Trader@Example.COM ", password="secret").email == "Trader@example.com"
@@ -1,6 +1,11 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
 
 from backend.strategy_templates.service import StrategyTemplateService
+from backend.tests.factories import next_uuid
 
 
 def test_select_wing_strikes_uses_adjacent_strikes_when_width_is_tight() -> None:
@@ -24,3 +29,46 @@ def test_select_wing_strikes_requires_both_sides_of_center() -> None:
             lower_width=50.0,
             upper_width=50.0,
         )
+
+
+def test_select_wing_strikes_picks_nearest_listed_strike_to_width() -> None:
+    strikes = [4800.0, 4875.0, 4925.0, 5000.0, 5025.0, 5075.0, 5125.0]
+    lower, upper = StrategyTemplateService._select_wing_strikes(
+        strikes=strikes,
+        center_strike=5000.0,
+        lower_width=100.0,
+        upper_width=100.0,
+    )
+    assert lower == 4875.0
+    assert upper == 5075.0
+
+
+async def test_resolve_skips_rows_without_call_delta_when_picking_center() -> None:
+    expiry = (datetime.now(UTC).date() + timedelta(days=10)).strftime("%Y%m%d")
+    chain = [
+        {"expiry": expiry, "strike": 4900.0, "call_delta": 0.7, "call_bid": 110.0, "call_ask": 112.0},
+        {"expiry": expiry, "strike": 4950.0, "call_delta": None, "call_bid": 70.0, "call_ask": 72.0},
+        {"expiry": expiry, "strike": 5000.0, "call_delta": 0.12, "call_bid": 40.0, "call_ask": 42.0},
+        {"expiry": expiry, "strike": 5050.0, "call_delta": 0.3, "call_bid": 20.0, "call_ask": 22.0},
+    ]
+    broker = SimpleNamespace(
+        get_options_chain=AsyncMock(return_value=chain),
+        get_market_data=AsyncMock(return_value={"underlying_price": 5000.0}),
+    )
+    template = SimpleNamespace(
+        id=1,
+        underlying_symbol="ES",
+        strategy_type="butterfly",
+        dte_min=1,
+        dte_max=30,
+        center_delta_target=0.05,
+        wing_width=100.0,
+        max_risk_per_trade=1_000_000.0,
+        sizing_method="fixed_contracts",
+        max_contracts=1,
+    )
+
+    resolved = await StrategyTemplateService(db=None).resolve_strategy_template(
+        next_uuid(), 1, broker, template=template
+    )
+    assert resolved.center_strike == 5000.0
@@ -1,30 +1,29 @@
-import uuid
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from backend.auth.jwt import hash_password
 from backend.brokers.mock import MockBroker
-from backend.db.models import AuditLog, Base, Client, StrategyTemplate, Trade, TradeFill
+from backend.db.models import AuditLog, Client, Position, StrategyTemplate, Trade, TradeFill
 from backend.safety.emergency_halt import EmergencyHaltController
 from backend.strategy_templates.service import ResolvedStrategy, StrategyTemplateService
+from backend.tests.engines import create_schema, create_test_engine
+from backend.tests.factories import HASHED_SECRET, make_client, next_uuid
 
 
-@pytest.mark.asyncio
 async def test_strategy_template_execution_blocked_by_emergency_halt() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     async with session_maker() as db:
-        client_id = uuid.uuid4()
+        client_id = next_uuid()
         db.add(
             Client(
                 id=client_id,
                 email="halt-template@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={},
@@ -59,20 +58,18 @@ async def test_strategy_template_execution_blocked_by_emergency_halt() -> None:
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_strategy_template_execution_persists_trade_fill(monkeypatch: pytest.MonkeyPatch) -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     async with session_maker() as db:
-        client_id = uuid.uuid4()
+        client_id = next_uuid()
         db.add(
             Client(
                 id=client_id,
                 email="template-fill@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={},
@@ -176,3 +173,101 @@ async def test_strategy_template_execution_persists_trade_fill(monkeypatch: pyte
         assert fill.fill_price == pytest.approx(3.2)
         assert fill.expected_price == pytest.approx(3.2)
     await engine.dispose()
+
+
+async def test_risk_snapshot_aggregates_todays_trades_and_open_positions() -> None:
+    engine = create_test_engine()
+    await create_schema(engine)
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as db:
+        client_id = next_uuid()
+        db.add(
+            Client(
+                id=client_id,
+                email="template-risk@example.com",
+                hashed_password=HASHED_SECRET,
+                broker_type="ibkr",
+                encrypted_creds="enc",
+                risk_params={},
+                mode="confirmation",
+                tier="basic",
+                is_active=True,
+            )
+        )
+        # Anchor to the start of the UTC day so the trades never straddle midnight.
+        day_start = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        for seconds_in, pnl in ((4, -600.0), (3, -700.0), (2, 250.0), (1, -800.0)):
+            db.add(
+                Trade(
+                    client_id=client_id,
+                    timestamp=day_start + timedelta(seconds=seconds_in),
+                    action="BUY",
+                    symbol="ES",
+                    instrument="BAG",
+                    qty=1,
+                    agent_reasoning="test",
+                    mode="confirmation",
+                    pnl=pnl,
+                )
+            )
+        db.add(
+            Trade(
+                client_id=client_id,
+                timestamp=day_start - timedelta(days=2),
+                action="BUY",
+                symbol="ES",
+                instrument="BAG",
+                qty=1,
+                agent_reasoning="previous session",
+                mode="confirmation",
+                pnl=-5000.0,
+            )
+        )
+        db.add(Position(client_id=client_id, symbol="ES", instrument_type="FOP", qty=1))
+        await db.commit()
+
+        snapshot = await StrategyTemplateService(db)._load_risk_snapshot(client_id)
+        assert snapshot.day_pnl == pytest.approx(-1850.0)
+        assert snapshot.recent_pnls == [-600.0, -700.0, 250.0]
+        assert snapshot.open_legs == 1
+    await engine.dispose()
+
+
+async def test_risk_snapshot_breaks_timestamp_ties_and_counts_missing_pnl_as_flat(db: AsyncSession) -> None:
+    client = make_client(email="template-risk-ties@example.com")
+    client_id = client.id
+    stamp = datetime.now(UTC).replace(hour=0, minute=0, second=1, microsecond=0)
+    db.add(client)
+    db.add_all(
+        Trade(
+            client_id=client_id,
+            timestamp=stamp,
+            action="BUY",
+            symbol="ES",
+            instrument="BAG",
+            qty=1,
+            agent_reasoning="test",
+            mode="confirmation",
+            pnl=pnl,
+        )
+        for pnl in (-900.0, -600.0, -700.0, None)
+    )
+    await db.commit()
+
+    snapshot = await StrategyTemplateService(db)._load_risk_snapshot(client_id)
+    # Newest id first among equal timestamps; the unfilled trade reads as 0.0 and ends the streak.
+    assert snapshot.recent_pnls == [0.0, -700.0, -600.0]
+    assert snapshot.day_pnl == pytest.approx(-2200.0)
+    assert snapshot.open_legs == 0
+
+
+async def test_risk_snapshot_without_trades_or_positions(db: AsyncSession) -> None:
+    client = make_client(email="template-risk-empty@example.com")
+    db.add(client)
+    await db.commit()
+
+    snapshot = await StrategyTemplateService(db)._load_risk_snapshot(client.id)
+    assert snapshot.day_pnl == 0.0
+    assert snapshot.recent_pnls == []
+    assert snapshot.open_legs == 0
@@ -1,34 +1,32 @@
-import uuid
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
 import pytest
-from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.api import trades as trades_api
 from backend.api.deps import get_current_client
-from backend.auth.jwt import hash_password
-from backend.db.models import AuditLog, Base, Client, Trade, TradeFill
+from backend.db.models import AuditLog, Client, Trade, TradeFill
 from backend.db.session import get_db_session
+from backend.tests.apps import create_test_app
+from backend.tests.engines import create_schema, create_test_engine
+from backend.tests.factories import HASHED_SECRET, next_uuid
 
 
-@pytest.mark.asyncio
 async def test_ingest_trade_fill_updates_trade_state() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
     async with session_maker() as db:
         db.add(
             Client(
                 id=client_id,
                 email="fills-a@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={},
@@ -54,8 +52,7 @@ async def test_ingest_trade_fill_updates_trade_state() -> None:
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(trades_api.router)
+    app = create_test_app(trades_api.router)
 
     async def override_current_client() -> SimpleNamespace:
         return SimpleNamespace(id=client_id)
@@ -110,20 +107,18 @@ async def test_ingest_trade_fill_updates_trade_state() -> None:
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_execution_quality_metrics_aggregates_fill_events() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
     async with session_maker() as db:
         db.add(
             Client(
                 id=client_id,
                 email="fills-b@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={},
@@ -198,8 +193,7 @@ async def test_execution_quality_metrics_aggregates_fill_events() -> None:
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(trades_api.router)
+    app = create_test_app(trades_api.router)
 
     async def override_current_client() -> SimpleNamespace:
         return SimpleNamespace(id=client_id)
@@ -234,20 +228,18 @@ async def test_execution_quality_metrics_aggregates_fill_events() -> None:
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_execution_quality_backfills_filled_trades_without_fill_events() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
     async with session_maker() as db:
         db.add(
             Client(
                 id=client_id,
                 email="fills-backfill@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={},
@@ -290,8 +282,7 @@ async def test_execution_quality_backfills_filled_trades_without_fill_events() -
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(trades_api.router)
+    app = create_test_app(trades_api.router)
 
     async def override_current_client() -> SimpleNamespace:
         return SimpleNamespace(id=client_id)
@@ -328,20 +319,18 @@ async def test_execution_quality_backfills_filled_trades_without_fill_events() -
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_create_and_list_execution_incident_notes() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
     async with session_maker() as db:
         db.add(
             Client(
                 id=client_id,
                 email="fills-incident@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={},
@@ -352,8 +341,7 @@ async def test_create_and_list_execution_incident_notes() -> None:
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(trades_api.router)
+    app = create_test_app(trades_api.router)
 
     async def override_current_client() -> SimpleNamespace:
         return SimpleNamespace(id=client_id)
@@ -394,20 +382,18 @@ async def test_create_and_list_execution_incident_notes() -> None:
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_ingest_trade_fill_idempotency_key_deduplicates_requests() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
     async with session_maker() as db:
         db.add(
             Client(
                 id=client_id,
                 email="fills-c@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={},
@@ -433,8 +419,7 @@ async def test_ingest_trade_fill_idempotency_key_deduplicates_requests() -> None
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(trades_api.router)
+    app = create_test_app(trades_api.router)
 
     async def override_current_client() -> SimpleNamespace:
         return SimpleNamespace(id=client_id)
@@ -483,20 +468,18 @@ async def test_ingest_trade_fill_idempotency_key_deduplicates_requests() -> None
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_ingest_trade_fill_broker_fill_id_deduplicates_requests() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
     async with session_maker() as db:
         db.add(
             Client(
                 id=client_id,
                 email="fills-d@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={},
@@ -522,8 +505,7 @@ async def test_ingest_trade_fill_broker_fill_id_deduplicates_requests() -> None:
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(trades_api.router)
+    app = create_test_app(trades_api.router)
 
     async def override_current_client() -> SimpleNamespace:
         return SimpleNamespace(id=client_id)
@@ -574,20 +556,18 @@ async def test_ingest_trade_fill_broker_fill_id_deduplicates_requests() -> None:
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_execution_quality_auto_remediation_pauses_autonomous_on_critical_alert() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
     async with session_maker() as db:
         db.add(
             Client(
                 id=client_id,
                 email="fills-auto-remediate@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={
@@ -638,8 +618,7 @@ async def test_execution_quality_auto_remediation_pauses_autonomous_on_critical_
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(trades_api.router)
+    app = create_test_app(trades_api.router)
 
     async def override_current_client() -> SimpleNamespace:
         return SimpleNamespace(id=client_id)
@@ -679,21 +658,19 @@ async def test_execution_quality_auto_remediation_pauses_autonomous_on_critical_
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_execution_quality_auto_remediation_respects_cooldown() -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
     now = datetime.now(timezone.utc)
     async with session_maker() as db:
         db.add(
             Client(
                 id=client_id,
                 email="fills-auto-remediate-cooldown@example.com",
-                hashed_password=hash_password("secret"),
+                hashed_password=HASHED_SECRET,
                 broker_type="ibkr",
                 encrypted_creds="enc",
                 risk_params={
@@ -748,8 +725,7 @@ async def test_execution_quality_auto_remediation_respects_cooldown() -> None:
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(trades_api.router)
+    app = create_test_app(trades_api.router)
 
     async def override_current_client() -> SimpleNamespace:
         return SimpleNamespace(id=client_id)
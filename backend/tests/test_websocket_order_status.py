@@ -2,13 +2,15 @@ import uuid
 from typing import Any
 
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.api import websocket as websocket_api
-from backend.db.models import Base, Client, Trade
+from backend.db.models import Client, Trade
+from backend.tests.apps import create_test_app
+from backend.tests.engines import create_schema, create_test_engine
+from backend.tests.factories import next_uuid
 
 
 class _FakeAgent:
@@ -38,14 +40,12 @@ def _wait_for_order_status(ws: Any, order_id: str, status: str, max_events: int
     raise AssertionError(f"Did not receive order_status transition for order_id={order_id}, status={status}")
 
 
-@pytest.mark.asyncio
 async def test_websocket_stream_emits_order_status_event(monkeypatch: pytest.MonkeyPatch) -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
 
     async with session_maker() as db:
         db.add(
@@ -78,8 +78,7 @@ async def test_websocket_stream_emits_order_status_event(monkeypatch: pytest.Mon
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(websocket_api.router)
+    app = create_test_app(websocket_api.router)
     app.state.db_sessionmaker = session_maker
     app.state.agent_manager = _FakeManager()
 
@@ -104,14 +103,12 @@ async def test_websocket_stream_emits_order_status_event(monkeypatch: pytest.Mon
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_websocket_stream_accepts_auth_token_in_first_message(monkeypatch: pytest.MonkeyPatch) -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
 
     async with session_maker() as db:
         db.add(
@@ -144,8 +141,7 @@ async def test_websocket_stream_accepts_auth_token_in_first_message(monkeypatch:
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(websocket_api.router)
+    app = create_test_app(websocket_api.router)
     app.state.db_sessionmaker = session_maker
     app.state.agent_manager = _FakeManager()
 
@@ -161,14 +157,12 @@ async def test_websocket_stream_accepts_auth_token_in_first_message(monkeypatch:
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_websocket_stream_emits_multiple_trade_transitions(monkeypatch: pytest.MonkeyPatch) -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
 
     async with session_maker() as db:
         db.add(
@@ -216,8 +210,7 @@ async def test_websocket_stream_emits_multiple_trade_transitions(monkeypatch: py
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(websocket_api.router)
+    app = create_test_app(websocket_api.router)
     app.state.db_sessionmaker = session_maker
     app.state.agent_manager = _FakeManager()
 
@@ -252,14 +245,12 @@ async def test_websocket_stream_emits_multiple_trade_transitions(monkeypatch: py
     await engine.dispose()
 
 
-@pytest.mark.asyncio
 async def test_websocket_stream_emits_sequential_status_updates_for_same_order(monkeypatch: pytest.MonkeyPatch) -> None:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_test_engine()
+    await create_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    client_id = uuid.uuid4()
+    client_id = next_uuid()
 
     async with session_maker() as db:
         db.add(
@@ -292,8 +283,7 @@ async def test_websocket_stream_emits_sequential_status_updates_for_same_order(m
         )
         await db.commit()
 
-    app = FastAPI()
-    app.include_router(websocket_api.router)
+    app = create_test_app(websocket_api.router)
     app.state.db_sessionmaker = session_maker
     app.state.agent_manager = _FakeManager()
 
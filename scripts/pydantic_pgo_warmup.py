@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Drive representative pydantic-core workloads while collecting a PGO profile."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.schemas import (  # noqa: E402
+    POSITION_LIST_ADAPTER,
+    TRADE_LIST_ADAPTER,
+    ChatResponse,
+    PositionOut,
+    StrategyPreviewOut,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Exercise backend schemas to train a PGO pydantic-core build.")
+    parser.add_argument("--iterations", type=int, default=500, help="Validate/serialize rounds per workload.")
+    return parser.parse_args()
+
+
+def sample_position(idx: int, now: datetime) -> dict:
+    return {
+        "id": idx,
+        "symbol": "ES",
+        "instrument_type": "FOP",
+        "strike": 5000.0 + idx,
+        "expiry": "20260320",
+        "qty": 1,
+        "delta": 0.5,
+        "gamma": 0.01,
+        "theta": -0.2,
+        "vega": 0.3,
+        "avg_price": 12.5,
+        "updated_at": now,
+    }
+
+
+def sample_trade(idx: int, now: datetime) -> dict:
+    return {
+        "id": idx,
+        "timestamp": now,
+        "action": "BUY",
+        "symbol": "ES",
+        "instrument": "FOP",
+        "qty": 1,
+        "fill_price": 12.5,
+        "order_id": f"OID-{idx}",
+        "agent_reasoning": "warmup",
+        "mode": "confirmation",
+        "status": "filled",
+        "pnl": 0.0,
+    }
+
+
+def sample_chat(now: datetime) -> dict:
+    return {
+        "mode": "confirmation",
+        "message": "warmup",
+        "executed": False,
+        "tool_trace_id": str(uuid.uuid4()),
+        "planned_tools": [{"name": "get_portfolio_greeks", "input": {}}],
+        "tool_calls": [
+            {"tool_use_id": "t1", "name": "get_portfolio_greeks", "input": {}, "started_at": now, "duration_ms": 3.0}
+        ],
+        "tool_results": [
+            {"tool_use_id": "t1", "name": "get_portfolio_greeks", "output": {"net_greeks": {"delta": 0.5}}, "success": True}
+        ],
+    }
+
+
+def sample_preview() -> dict:
+    leg = {
+        "action": "BUY",
+        "ratio": 1,
+        "symbol": "ES",
+        "instrument": "FOP",
+        "expiry": "20260320",
+        "strike": 4950.0,
+        "right": "C",
+        "delta": 0.6,
+        "mid_price": 10.0,
+    }
+    return {
+        "template_id": 1,
+        "strategy_type": "butterfly",
+        "expiry": "20260320",
+        "dte": 30,
+        "center_strike": 5000.0,
+        "estimated_net_premium": 2.5,
+        "estimated_max_risk": 2375.0,
+        "estimated_net_delta": 0.01,
+        "contracts": 1,
+        "greeks": {"delta": 0.01, "gamma": 0.0, "theta": 0.1, "vega": -0.2},
+        "pnl_curve": [{"underlying": 5000.0, "pnl": 100.0}],
+        "legs": [leg, {**leg, "action": "SELL", "ratio": 2, "strike": 5000.0}, {**leg, "strike": 5050.0}],
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    now = datetime.now(timezone.utc)
+    positions = [sample_position(idx, now) for idx in range(50)]
+    trades = [sample_trade(idx, now) for idx in range(50)]
+    chat = sample_chat(now)
+    preview = sample_preview()
+
+    for _ in range(args.iterations):
+        for row in positions[:5]:
+            PositionOut.model_validate(row)
+        POSITION_LIST_ADAPTER.dump_json(POSITION_LIST_ADAPTER.validate_python(positions))
+        TRADE_LIST_ADAPTER.dump_json(TRADE_LIST_ADAPTER.validate_python(trades))
+        ChatResponse.model_validate(chat).model_dump(mode="json")
+        StrategyPreviewOut.model_validate(preview).model_dump_json()
+    print(f"pydantic-core PGO warmup completed ({args.iterations} iterations).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())